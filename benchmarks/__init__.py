@@ -0,0 +1,3 @@
+"""
+Loggissimo benchmarks, run with `python -m benchmarks`.
+"""
@@ -0,0 +1,39 @@
+import sys
+import json
+import time
+import argparse
+import platform
+
+import loggissimo
+
+from .cases import run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-o", "--output", type=str, default="")
+    parser.add_argument("-n", "--calls", type=int, default=20_000)
+    parser.add_argument(
+        "-w", "--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32]
+    )
+    args = parser.parse_args()
+
+    report = {
+        "loggissimo": loggissimo.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "calls": args.calls,
+        "results": run(args.calls, args.workers),
+    }
+
+    dumped = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(dumped)
+    else:
+        sys.stdout.write(dumped + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+import os
+import time
+import shutil
+import tempfile
+import threading
+import tracemalloc
+import multiprocessing
+
+from itertools import count
+from typing import Any, Callable, Dict, List
+
+from loggissimo import Logger, Level
+
+CUSTOM_FORMAT = "<font=cyan>$name | <style=bold bg=1,2,3 font=255,0,0>$time | <font=yellow bg=red>$text"
+
+_names = count()
+
+
+class NullStdout:
+    """
+    Discarding stream which is colorized like the real stdout.
+    """
+
+    name = "<stdout>"
+    closed = False
+
+    def write(self, message: str) -> int:
+        return len(message)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class Case:
+    def __init__(self, directory: str, calls: int) -> None:
+        self.directory = directory
+        self.calls = calls
+
+    def logger(self, format: str = "", stdout: bool = False) -> Logger:
+        name = f"bench-{next(_names)}"
+        kwargs: Dict[str, Any] = {"format": format} if format else {}
+        log = Logger(name, **kwargs)
+        log.clear()
+        if stdout:
+            log.add(NullStdout())
+        return log
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}-{next(_names)}.log")
+
+    def ns_per_call(self, call: Callable[[], Any], calls: int = 0) -> float:
+        calls = calls or self.calls
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            call()
+        return (time.perf_counter_ns() - start) / calls
+
+
+def levels(case: Case) -> Dict[str, float]:
+    log = case.logger()
+    log.add(case.path("levels"), level=Level.INFO)
+    lazy = log.opt(lazy=True)
+    return {
+        "enabled_ns": case.ns_per_call(lambda: log.info("enabled")),
+        "disabled_ns": case.ns_per_call(lambda: log.debug("disabled")),
+        "disabled_args_ns": case.ns_per_call(
+            lambda: log.debug("disabled {}", case.calls)
+        ),
+        "disabled_lazy_ns": case.ns_per_call(
+            lambda: lazy.debug("disabled {}", lambda: case.calls)
+        ),
+    }
+
+
+def formats(case: Case) -> Dict[str, float]:
+    default = case.logger(stdout=True)
+    custom = case.logger(CUSTOM_FORMAT, stdout=True)
+    return {
+        "default_ns": case.ns_per_call(lambda: default.info("default")),
+        "custom_tags_ns": case.ns_per_call(lambda: custom.info("custom")),
+    }
+
+
+def sinks(case: Case) -> Dict[str, float]:
+    stdout = case.logger(stdout=True)
+    file = case.logger()
+    file.add(case.path("file"))
+    multiple = case.logger()
+    for _ in range(4):
+        multiple.add(case.path("multiple"))
+    return {
+        "stdout_ns": case.ns_per_call(lambda: stdout.info("stdout")),
+        "file_ns": case.ns_per_call(lambda: file.info("file")),
+        "four_files_ns": case.ns_per_call(lambda: multiple.info("four files")),
+    }
+
+
+def _log_lines(log: Logger, calls: int) -> None:
+    for _ in range(calls):
+        log.info("scaling")
+
+
+def _process_target(path: str, calls: int) -> None:
+    log = Logger(f"bench-process-{os.getpid()}")
+    log.clear()
+    log.add(path)
+    _log_lines(log, calls)
+
+
+def threads(case: Case, workers: List[int]) -> Dict[str, float]:
+    results = {}
+    calls = max(case.calls // 10, 1)
+    for number in workers:
+        log = case.logger()
+        log.add(case.path("threads"))
+        pool = [
+            threading.Thread(target=_log_lines, args=(log, calls))
+            for _ in range(number)
+        ]
+        start = time.perf_counter_ns()
+        [thread.start() for thread in pool]
+        [thread.join() for thread in pool]
+        results[f"{number}_lines_per_s"] = number * calls / (time.perf_counter_ns() - start) * 1e9
+    return results
+
+
+def processes(case: Case, workers: List[int]) -> Dict[str, float]:
+    results = {}
+    calls = max(case.calls // 10, 1)
+    context = multiprocessing.get_context("fork")
+    for number in workers:
+        pool = [
+            context.Process(target=_process_target, args=(case.path("process"), calls))
+            for _ in range(number)
+        ]
+        start = time.perf_counter_ns()
+        [proc.start() for proc in pool]
+        [proc.join() for proc in pool]
+        results[f"{number}_lines_per_s"] = number * calls / (time.perf_counter_ns() - start) * 1e9
+    return results
+
+
+def memory(case: Case) -> Dict[str, float]:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        loggers = [case.logger() for _ in range(100)]
+        per_logger = (tracemalloc.get_traced_memory()[0] - before) / len(loggers)
+
+        log = loggers[-1]
+        log.add(case.path("memory"))
+        log.info("warm up")
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        log.info("record")
+        per_record = tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+    return {"logger_bytes": per_logger, "record_peak_bytes": per_record}
+
+
+def run(calls: int, workers: List[int]) -> Dict[str, Dict[str, float]]:
+    directory = tempfile.mkdtemp(prefix="loggissimo-bench-")
+    level = Logger().level
+    Logger().level = Level.INFO
+    try:
+        case = Case(directory, calls)
+        return {
+            "levels": levels(case),
+            "formats": formats(case),
+            "sinks": sinks(case),
+            "threads": threads(case, workers),
+            "processes": processes(case, workers),
+            "memory": memory(case),
+        }
+    finally:
+        Logger().level = level
+        shutil.rmtree(directory)
@@ -1,5 +1,50 @@
-from ._logger import Logger, Level
+from typing import Any, Dict, Tuple
 
-logger = Logger()
+from .constants import Level, Overflow, Serializer
 
 __version__ = "1.0.5"
+
+# Public name to its module, modules are imported on the first attribute access
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "Logger": ("._logger", "Logger"),
+    "QueuedStream": ("._queue", "QueuedStream"),
+    "AsyncStream": ("._async", "AsyncStream"),
+    "ProcessStream": ("._process", "ProcessStream"),
+    "FileStream": ("._file", "FileStream"),
+    "BufferedStream": ("._buffered", "BufferedStream"),
+    "MemorySink": ("._memory", "MemorySink"),
+    "LogRecord": ("._record", "LogRecord"),
+    "ExceptionInfo": ("._exception", "ExceptionInfo"),
+    "RingStream": (".ring", "RingStream"),
+    "read_ring": (".ring", "read_ring"),
+    "Limit": ("._limits", "Limit"),
+    "Sample": ("._limits", "Sample"),
+    "RateLimit": ("._limits", "RateLimit"),
+    "Throttle": ("._limits", "Throttle"),
+    "read_binary": ("._serialize", "read_binary"),
+}
+
+__all__ = ["Level", "Overflow", "Serializer", "logger", *_LAZY]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "logger":
+        from ._logger import Logger
+
+        value: Any = Logger()
+    else:
+        try:
+            module, attribute = _LAZY[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        from importlib import import_module
+
+        value = getattr(import_module(module, __name__), attribute)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+
+from collections import deque
+from typing import IO, Deque, List, Optional
+
+from ._utils import join_messages, print_trace
+from .constants import DEFAULT_QUEUE_BATCH, DEFAULT_QUEUE_SIZE
+
+
+class AsyncStream:
+    """
+    Stream wrapper which never blocks the event loop.
+
+    Messages are queued and written in batches by a task of the event loop the
+    stream is first written from, blocking writes are done in the default
+    executor. Outside of a running loop the stream writes synchronously.
+
+    Args
+    ----
+        stream (IO): Wrapped output stream.
+        size (int): Queue length `await logger.ainfo(...)` and friends wait to fall below.
+        batch (int): Maximum number of messages joined into one write.
+        executor (bool): Write from the default executor instead of the loop thread.
+    """
+
+    thread_safe = True
+
+    def __init__(
+        self,
+        stream: IO,
+        size: int = DEFAULT_QUEUE_SIZE,
+        batch: int = DEFAULT_QUEUE_BATCH,
+        executor: bool = True,
+    ) -> None:
+        self.stream = stream
+        self.size = size
+        self.batch = batch
+        self.executor = executor
+
+        self._queue: Deque[str | bytes] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._written: Optional[asyncio.Event] = None
+
+    @property
+    def name(self) -> str:
+        return self.stream.name
+
+    @property
+    def closed(self) -> bool:
+        return self.stream.closed
+
+    def _bind(self) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        self._loop = loop
+        self._thread = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._written = asyncio.Event()
+        self._task = loop.create_task(self._drain())
+        return True
+
+    def write(self, message: str | bytes) -> int:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            if not self._bind():
+                self._write_pending()
+                return self.stream.write(message)
+            loop = self._loop
+
+        self._queue.append(message)
+        if threading.get_ident() == self._thread:
+            self._notify()
+        else:
+            loop.call_soon_threadsafe(self._notify)  # type: ignore
+        return len(message)
+
+    def _notify(self) -> None:
+        self._idle.clear()  # type: ignore
+        self._wakeup.set()  # type: ignore
+
+    def _take(self) -> List[str | bytes]:
+        return [self._queue.popleft() for _ in range(min(self.batch, len(self._queue)))]
+
+    def _write(self, data: str | bytes) -> None:
+        try:
+            self.stream.write(data)
+            self.stream.flush()
+        except Exception as ex:
+            print_trace(ex)
+
+    def _write_pending(self) -> None:
+        while self._queue:
+            self._write(join_messages(self._take()))
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await self._wakeup.wait()  # type: ignore
+                self._wakeup.clear()  # type: ignore
+                while self._queue:
+                    data = join_messages(self._take())
+                    if self.executor:
+                        await loop.run_in_executor(None, self._write, data)
+                    else:
+                        self._write(data)
+                    self._written.set()  # type: ignore
+                if not self._queue:
+                    self._idle.set()  # type: ignore
+        finally:
+            self._write_pending()
+            self._idle.set()  # type: ignore
+
+    async def wait(self) -> None:
+        """
+        Wait until the queue is shorter than `size`.
+        """
+        while len(self._queue) >= self.size and self._task and not self._task.done():
+            self._written.clear()  # type: ignore
+            await self._written.wait()  # type: ignore
+
+    async def join(self) -> None:
+        """
+        Wait until all queued messages are written.
+        """
+        if self._idle is not None and self._loop is asyncio.get_running_loop():
+            await self._idle.wait()
+
+    async def complete(self) -> None:
+        """
+        Write all queued messages and stop the writer task.
+        """
+        await self.join()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._loop = self._task = None
+        self.stream.flush()
+
+    def flush(self) -> None:
+        """
+        Wait until all queued messages are written, from the loop thread use `await complete()`.
+        """
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            if threading.get_ident() != self._thread:
+                asyncio.run_coroutine_threadsafe(self.join(), loop).result()
+        else:
+            self._write_pending()
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.stream.close()
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.AsyncStream name={self.name!r} queued={len(self._queue)}>"
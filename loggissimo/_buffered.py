@@ -0,0 +1,161 @@
+import os
+import atexit
+import threading
+
+from typing import IO, Dict, List
+
+from ._utils import print_trace
+from .constants import (
+    DEFAULT_BUFFER_INTERVAL,
+    DEFAULT_BUFFER_SIZE,
+    IOV_MAX,
+    Level,
+)
+
+
+class BufferedStream:
+    """
+    Stream collecting messages in memory and writing them with one syscall per flush.
+
+    The buffer is flushed when it exceeds `size` bytes, when the oldest message
+    is older than `interval` seconds, after a record of `flush_level` or higher
+    and at exit. Each flush is a single `os.writev` of the buffered messages, so
+    concurrent threads never interleave partial lines.
+
+    Args
+    ----
+        stream (IO | str): IO object with a file descriptor or filename, files are opened for appending.
+        size (int): Buffer size in bytes which triggers a flush.
+        interval (float): Maximum time in seconds a message stays in the buffer.
+        flush_level (Level | str): Records of this level and higher are written immediately.
+        encoding (str): Encoding of text messages.
+    """
+
+    thread_safe = True
+
+    def __init__(
+        self,
+        stream: IO | str,
+        size: int = DEFAULT_BUFFER_SIZE,
+        interval: float = DEFAULT_BUFFER_INTERVAL,
+        flush_level: Level | str = Level.ERROR,
+        encoding: str = "utf-8",
+    ) -> None:
+        if isinstance(stream, str):
+            self._name = stream
+            self._fd = os.open(stream, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._owns_fd = True
+        else:
+            stream.flush()
+            self._name = stream.name
+            self._fd = stream.fileno()
+            self._owns_fd = False
+
+        self.size = size
+        self.interval = interval
+        self.flush_level = (
+            Level[flush_level] if isinstance(flush_level, str) else flush_level
+        )
+        self.encoding = encoding
+
+        self._lock = threading.Lock()
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        self._lines = 0
+        self._syscalls = 0
+        self._closed = False
+        self._stop = threading.Event()
+        self._timer = threading.Thread(
+            target=self._flush_periodically,
+            name=f"loggissimo-buffer {self._name}",
+            daemon=True,
+        )
+        self._timer.start()
+        atexit.register(self.close)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def write(self, message: str | bytes) -> int:
+        data = message if isinstance(message, bytes) else message.encode(self.encoding)
+        with self._lock:
+            if self._closed:
+                self._writev([data])
+                return len(message)
+            self._buffer.append(data)
+            self._buffered += len(data)
+            if self._buffered >= self.size:
+                self._flush()
+        return len(message)
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        buffer, self._buffer, self._buffered = self._buffer, [], 0
+        try:
+            self._writev(buffer)
+        except Exception as ex:
+            print_trace(ex)
+
+    def _writev(self, buffer: List[bytes]) -> None:
+        self._lines += len(buffer)
+        if len(buffer) > IOV_MAX or not hasattr(os, "writev"):
+            buffer = [b"".join(buffer)]
+
+        total = sum(len(data) for data in buffer)
+        if len(buffer) > 1:
+            written = os.writev(self._fd, buffer)
+        else:
+            written = os.write(self._fd, buffer[0])
+        self._syscalls += 1
+
+        if written < total:
+            rest = memoryview(b"".join(buffer))[written:]
+            while rest:
+                written = os.write(self._fd, rest)
+                self._syscalls += 1
+                rest = rest[written:]
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                self._flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get number of written lines, write syscalls and lines per syscall.
+        """
+        with self._lock:
+            return {
+                "lines": self._lines,
+                "syscalls": self._syscalls,
+                "lines_per_syscall": (
+                    self._lines / self._syscalls if self._syscalls else 0.0
+                ),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._flush()
+            self._closed = True
+        self._stop.set()
+        atexit.unregister(self.close)
+        if self._owns_fd:
+            os.close(self._fd)
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.BufferedStream name={self._name!r} buffered={self._buffered}>"
@@ -0,0 +1,71 @@
+from types import TracebackType
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional, Type
+
+
+class Extra(dict):
+    """
+    Extra record fields, placeholders of missing fields are rendered as is.
+
+    Compiled formats look fields up by their placeholder without the closing bracket,
+    `$key`, `${key` or `$extra[key`, so numeric keys stay strings and a missing field
+    renders as the placeholder written in the format.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> Any:
+        if key.startswith("$extra["):
+            field, placeholder = key[7:], f"{key}]"
+        elif key.startswith("${"):
+            field, placeholder = key[2:], f"{key}}}"
+        elif key.startswith("$"):
+            field, placeholder = key[1:], key
+        else:
+            return f"${key}"
+        return self.get(field, placeholder)
+
+
+EMPTY_EXTRA: Extra = Extra()
+
+_context_extra: ContextVar[Extra] = ContextVar("loggissimo_extra", default=EMPTY_EXTRA)
+
+
+def current_extra(bound: Extra) -> Extra:
+    """
+    Merge extra fields of the current context with the bound ones, bound fields win.
+    """
+    context = _context_extra.get()
+    if not bound:
+        return context
+    if not context:
+        return bound
+    return Extra(context, **bound)
+
+
+class Contextualize:
+    """
+    Context manager adding extra fields to every record logged inside it.
+
+    Fields are stored in a context variable, so they follow asyncio tasks
+    and do not leak into other threads.
+    """
+
+    __slots__ = ("_extra", "_token")
+
+    def __init__(self, extra: Dict[str, Any]) -> None:
+        self._extra = extra
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> None:
+        self._token = _context_extra.set(Extra(_context_extra.get(), **self._extra))
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._token is not None:
+            _context_extra.reset(self._token)
+            self._token = None
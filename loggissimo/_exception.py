@@ -0,0 +1,181 @@
+import sys
+import time
+
+from itertools import count
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .constants import TRACEBACK_CACHE_SIZE, TRACEBACK_WINDOW
+
+# File name, line number and function name of a traceback frame
+Frame = Tuple[str, int, str]
+
+_CAUSE = "\nThe above exception was the direct cause of the following exception:\n\n"
+_CONTEXT = "\nDuring handling of the above exception, another exception occurred:\n\n"
+
+_texts: Dict[int, str] = {}
+
+
+class ExceptionInfo:
+    """
+    Exception captured as compact frame tuples, source lines are read only when it is rendered.
+
+    Identical tracebacks, same exception types raised from the same lines, share a key
+    and are counted, repeated ones are rendered as a single line.
+    """
+
+    __slots__ = ("type", "message", "frames", "chained", "key", "count")
+
+    def __init__(
+        self,
+        type: str,
+        message: str,
+        frames: Tuple[Frame, ...],
+        chained: Optional[Tuple[str, "ExceptionInfo"]] = None,
+    ) -> None:
+        self.type = type
+        self.message = message
+        self.frames = frames
+        # Separator and exception this one was raised from or during handling of
+        self.chained = chained
+        self.key = hash((type, frames, chained and chained[1].key))
+        self.count = 1
+
+    @property
+    def digest(self) -> str:
+        return f"{self.key & 0xFFFFFFFF:08x}"
+
+    def text(self) -> str:
+        """
+        Render the traceback like the interpreter does, or one line if it was already logged.
+        """
+        if self.count > 1:
+            return (
+                f"{self.type}: {self.message} "
+                f"[traceback {self.digest} repeated, {self.count} occurrences]\n"
+            )
+
+        if self.chained is not None:
+            return self._full()
+        # Traceback of a key does not change, only the message does
+        try:
+            traceback = _texts[self.key]
+        except KeyError:
+            if len(_texts) >= TRACEBACK_CACHE_SIZE:
+                _texts.clear()
+            traceback = _texts[self.key] = self._traceback()
+        return f"{traceback}{self.type}: {self.message}\n"
+
+    def _traceback(self) -> str:
+        import linecache
+
+        lines: List[str] = []
+        if self.chained is not None:
+            separator, chained = self.chained
+            lines.append(chained._full())
+            lines.append(separator)
+
+        lines.append("Traceback (most recent call last):\n")
+        for filename, lineno, function in self.frames:
+            lines.append(f'  File "{filename}", line {lineno}, in {function}\n')
+            source = linecache.getline(filename, lineno).strip()
+            if source:
+                lines.append(f"    {source}\n")
+        return "".join(lines)
+
+    def _full(self) -> str:
+        return f"{self._traceback()}{self.type}: {self.message}\n"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get exception fields written by serializing streams.
+        """
+        return {
+            "type": self.type,
+            "message": self.message,
+            "frames": [list(frame) for frame in self.frames],
+            "chained": self.chained[1].to_dict() if self.chained else None,
+            "key": self.digest,
+            "count": self.count,
+        }
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.ExceptionInfo {self.type}: {self.message!r} key={self.digest} count={self.count}>"
+
+
+class Occurrences:
+    """
+    Occurrence counts of tracebacks logged by one logger.
+    Counts start over every `window` seconds, so a traceback repeated after that
+    is rendered in full again.
+    """
+
+    __slots__ = ("window", "_counters", "_reset")
+
+    def __init__(self, window: float = TRACEBACK_WINDOW) -> None:
+        self.window = window
+        self._counters: Dict[int, Iterator[int]] = {}
+        self._reset = time.monotonic() + window
+
+    def count(self, key: int) -> int:
+        now = time.monotonic()
+        if now >= self._reset or len(self._counters) >= TRACEBACK_CACHE_SIZE:
+            self._counters = {}
+            self._reset = now + self.window
+        counters = self._counters
+        counter = counters.get(key)
+        if counter is None:
+            counter = counters.setdefault(key, count(1))
+        # next() on itertools.count is atomic, concurrent captures get distinct counts
+        return next(counter)
+
+
+def capture(
+    exc_info: Any, occurrences: Optional[Occurrences] = None
+) -> Optional[ExceptionInfo]:
+    """
+    Capture exception given as `exc_info`: True for the one being handled, an exception
+    or a `sys.exc_info()` tuple. Returns None if there is no exception.
+    Repeats are counted in `occurrences`, every capture is the first one without it.
+    """
+    if exc_info is True:
+        exception = sys.exc_info()[1]
+    elif isinstance(exc_info, BaseException):
+        exception = exc_info
+    elif isinstance(exc_info, tuple):
+        exception = exc_info[1]
+    else:
+        exception = None
+    if exception is None:
+        return None
+
+    info = _capture(exception, set())
+    if occurrences is not None:
+        info.count = occurrences.count(info.key)
+    return info
+
+
+def _capture(exception: BaseException, seen: set) -> ExceptionInfo:
+    seen.add(id(exception))
+
+    frames = []
+    traceback = exception.__traceback__
+    while traceback is not None:
+        code = traceback.tb_frame.f_code
+        frames.append((code.co_filename, traceback.tb_lineno, code.co_name))
+        traceback = traceback.tb_next
+
+    chained = None
+    cause = exception.__cause__
+    context = exception.__context__
+    if cause is not None and id(cause) not in seen:
+        chained = (_CAUSE, _capture(cause, seen))
+    elif (
+        context is not None
+        and not exception.__suppress_context__
+        and id(context) not in seen
+    ):
+        chained = (_CONTEXT, _capture(context, seen))
+
+    return ExceptionInfo(
+        type(exception).__qualname__, str(exception), tuple(frames), chained
+    )
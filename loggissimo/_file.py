@@ -0,0 +1,170 @@
+import os
+import bz2
+import glob
+import gzip
+import lzma
+import time
+import shutil
+import atexit
+import threading
+
+from datetime import datetime, timedelta
+from typing import IO, Callable, Dict, List, Optional
+
+from ._utils import print_trace
+from .exceptions import LoggissimoError
+
+COMPRESSIONS: Dict[str, Callable[..., IO]] = {
+    "gz": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+
+class FileStream:
+    """
+    Appending file stream with rotation, retention and compression.
+
+    Rotation is checked against a counter of written bytes and a precomputed
+    deadline, so a write never touches the file system metadata. Rotated files
+    are compressed and cleaned up by a background thread.
+
+    Args
+    ----
+        path (str): Log file path.
+        rotation (int | timedelta | None): Rotate after the file exceeds this many bytes or after this interval.
+        retention (int | None): Number of rotated files to keep, all are kept if None.
+        compression (str | None): Compress rotated files, one of "gz", "bz2", "xz".
+        encoding (str): File encoding.
+    """
+
+    thread_safe = True
+
+    def __init__(
+        self,
+        path: str,
+        rotation: int | timedelta | None = None,
+        retention: Optional[int] = None,
+        compression: Optional[str] = None,
+        encoding: str = "utf-8",
+    ) -> None:
+        if compression is not None and compression not in COMPRESSIONS:
+            raise LoggissimoError(
+                f"Unknown compression {compression!r}, use one of {list(COMPRESSIONS)}"
+            )
+
+        self.path = path
+        self.encoding = encoding
+        self.retention = retention
+        self.compression = compression
+        self.max_size: Optional[int] = None
+        self.interval: Optional[float] = None
+        if isinstance(rotation, timedelta):
+            self.interval = rotation.total_seconds()
+        elif rotation is not None:
+            self.max_size = rotation
+
+        self._lock = threading.Lock()
+        self._rotation_lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+        self._open()
+        atexit.register(self.close)
+
+    def _open(self) -> None:
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+        self._rotate_at = (
+            time.time() + self.interval if self.interval is not None else None
+        )
+
+    @property
+    def name(self) -> str:
+        return self.path
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, message: str | bytes) -> int:
+        data = (
+            message if isinstance(message, bytes) else message.encode(self.encoding)
+        )
+        with self._lock:
+            if (self.max_size is not None and self._size >= self.max_size) or (
+                self._rotate_at is not None and time.time() >= self._rotate_at
+            ):
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+        return len(message)
+
+    def _rotate(self) -> None:
+        if not self._size:
+            self._rotate_at = (
+                time.time() + self.interval if self.interval is not None else None
+            )
+            return
+
+        self._file.close()
+        rotated = f"{self.path}.{datetime.now().strftime('%Y-%m-%d_%H-%M-%S_%f')}"
+        os.rename(self.path, rotated)
+        self._open()
+
+        worker = threading.Thread(
+            target=self._finish_rotation,
+            args=(rotated,),
+            name=f"loggissimo-rotation {self.path}",
+            daemon=True,
+        )
+        self._workers = [thread for thread in self._workers if thread.is_alive()]
+        self._workers.append(worker)
+        worker.start()
+
+    def _finish_rotation(self, rotated: str) -> None:
+        with self._rotation_lock:
+            self._compress_and_clean(rotated)
+
+    def _compress_and_clean(self, rotated: str) -> None:
+        try:
+            if self.compression is not None:
+                with open(rotated, "rb") as source, COMPRESSIONS[self.compression](
+                    f"{rotated}.{self.compression}", "wb"
+                ) as target:
+                    shutil.copyfileobj(source, target)
+                os.remove(rotated)
+
+            if self.retention is not None:
+                files = sorted(glob.glob(f"{glob.escape(self.path)}.*"))
+                for file in files[: max(len(files) - self.retention, 0)]:
+                    os.remove(file)
+        except Exception as ex:
+            print_trace(ex)
+
+    def rotate(self) -> None:
+        """
+        Rotate the file now.
+        """
+        with self._lock:
+            self._rotate()
+
+    def flush(self) -> None:
+        """
+        Flush the file and wait for running compressions.
+        """
+        with self._lock:
+            self._file.flush()
+            workers = list(self._workers)
+        for worker in workers:
+            worker.join()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.flush()
+        atexit.unregister(self.close)
+        with self._lock:
+            self._file.close()
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.FileStream path={self.path!r} size={self._size}>"
@@ -0,0 +1,67 @@
+import threading
+
+from fnmatch import fnmatchcase
+from typing import Dict, Mapping, Optional, Tuple
+
+
+class ModuleFilter:
+    """
+    Enable/disable rules for modules.
+
+    A rule applies to the module and all its submodules, the most specific
+    rule wins. Rules with `*`, `?` or `[...]` are wildcards matched against
+    every dotted prefix of the module, on the same prefix exact rules win over
+    wildcards and later wildcards win over earlier ones. Modules without rules
+    are enabled.
+
+    Rules are replaced copy-on-write, so checks never take a lock.
+
+    Args
+    ----
+        rules (Mapping[str, bool] | None): Initial rules, module name or wildcard to enabled flag.
+    """
+
+    def __init__(self, rules: Optional[Mapping[str, bool]] = None) -> None:
+        self._lock = threading.Lock()
+        self._rules: Tuple[Dict[str, bool], Tuple[Tuple[str, bool], ...]] = ({}, ())
+        for pattern, enabled in (rules or {}).items():
+            self.set(pattern, enabled)
+
+    @staticmethod
+    def _is_wildcard(pattern: str) -> bool:
+        return any(char in pattern for char in "*?[")
+
+    def set(self, pattern: str, enabled: bool) -> None:
+        with self._lock:
+            exact, wildcards = self._rules
+            if self._is_wildcard(pattern):
+                wildcards = tuple(
+                    rule for rule in wildcards if rule[0] != pattern
+                ) + ((pattern, enabled),)
+            else:
+                exact = {**exact, pattern: enabled}
+            self._rules = (exact, wildcards)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rules = ({}, ())
+
+    def __call__(self, module: Optional[str]) -> bool:
+        if module is None:
+            return True
+
+        exact, wildcards = self._rules
+        parts = module.split(".")
+        for end in range(len(parts), 0, -1):
+            prefix = ".".join(parts[:end])
+            enabled = exact.get(prefix)
+            if enabled is not None:
+                return enabled
+            for pattern, enabled in reversed(wildcards):
+                if fnmatchcase(prefix, pattern):
+                    return enabled
+        return True
+
+    def __repr__(self) -> str:
+        exact, wildcards = self._rules
+        return f"<loggissimo.ModuleFilter rules={({**exact, **dict(wildcards)})}>"
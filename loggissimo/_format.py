@@ -0,0 +1,84 @@
+import re
+
+from string import Template
+from functools import lru_cache
+
+from .constants import Level
+from ._style import style
+
+FIELD_SPECS = {
+    "name": "{name:30}",
+    "time": "{time}",
+    "level": "{level:<9}",
+    "stack": "{stack}",
+    "text": "{text}",
+}
+
+EXTRA_KEY = re.compile(r"\[([^\]\[{}]+)\]")
+
+
+@lru_cache(maxsize=256)
+def compile_format(
+    format: str,
+    level: Level,
+    basic_colors: bool = False,
+    only_remove_tags: bool = False,
+) -> str:
+    """
+    Compile logger format into a ready to use `str.format` template.
+
+    Tags and level palette are resolved once per `(format, level, basic_colors, only_remove_tags)`
+    combination, so a log call only has to fill the fields in.
+
+    Args
+    ----
+        format (str): Logger format string, e.g. `"$name@ $time |$level| $stack: $text"`.
+        level (Level): Level the palette is taken for.
+        basic_colors (bool): Use basic terminal colors instead of rgb.
+        only_remove_tags (bool): Strip tags without colorizing.
+
+    Returns
+    -------
+        str: Template with `name`, `time`, `level`, `stack`, `text` and `extra` replacement fields.
+            Other placeholders, `$key` and `$extra[key]`, are looked up in `extra`.
+    """
+    styled = style(format, level, basic_colors, only_remove_tags)
+
+    compiled = []
+    position = 0
+    for match in Template.pattern.finditer(styled):
+        compiled.append(_escape(styled[position : match.start()]))
+        position = match.end()
+
+        if match.group("escaped") is not None:
+            compiled.append("$")
+            continue
+
+        field = match.group("named") or match.group("braced")
+        if not field:
+            compiled.append(_escape(match.group()))
+            continue
+
+        if field == "extra":
+            key = EXTRA_KEY.match(styled, position)
+            if key:
+                compiled.append(f"{{extra[$extra[{key.group(1)}]}}")
+                position = key.end()
+                continue
+
+        spec = FIELD_SPECS.get(field)
+        if spec is None:
+            # Extra fields are looked up by placeholder without its closing bracket, see `Extra`
+            placeholder = match.group()
+            if match.group("braced"):
+                placeholder = placeholder[:-1]
+            spec = f"{{extra[{placeholder}]}}"
+        compiled.append(spec)
+
+    compiled.append(_escape(styled[position:]))
+    compiled.append("\n")
+    return "".join(compiled)
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
@@ -0,0 +1,54 @@
+import os
+import sys
+import threading
+
+from typing import NamedTuple
+
+
+class Identity(NamedTuple):
+    process: int
+    process_name: str
+    thread: int
+    thread_name: str
+    # Name shown next to the logger name, empty in the main thread of the main process
+    label: str
+
+
+_local = threading.local()
+
+
+def current_identity() -> Identity:
+    """
+    Get identity of the calling thread, it is computed once per thread and process.
+    """
+    try:
+        return _local.identity
+    except AttributeError:
+        pass
+
+    # Processes can be named only through multiprocessing, it is not imported just for the name
+    multiprocessing = sys.modules.get("multiprocessing")
+    process_name = (
+        multiprocessing.current_process().name if multiprocessing else "MainProcess"
+    )
+    thread = threading.current_thread()
+
+    label = ""
+    if process_name != "MainProcess":
+        label = process_name
+    if thread.name != "MainThread":
+        label = thread.name
+
+    _local.identity = Identity(
+        os.getpid(), process_name, threading.get_ident(), thread.name, label
+    )
+    return _local.identity
+
+
+def _reset_after_fork() -> None:
+    global _local
+    _local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
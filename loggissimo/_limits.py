@@ -0,0 +1,246 @@
+import time
+import random
+import threading
+
+from abc import ABC, abstractmethod
+from itertools import count
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .constants import Level
+from .exceptions import LoggissimoError
+
+# Call site of a log call, code object and line number
+Site = Tuple[Any, int]
+# Number of suppressed records per module and call site
+Counters = Dict[Tuple[Optional[str], Site], int]
+
+
+class Limit(ABC):
+    """
+    Base of sampling and rate limiting policies.
+
+    Policies are checked before a record is formatted, a record suppressed by
+    any of them costs only the check. A policy applies to records of its level
+    and lower levels, and to its module and all its submodules.
+
+    Args
+    ----
+        level (Level | str | None): Highest level the policy applies to, all levels if None.
+        module (str | None): Module the policy applies to, all modules if None.
+    """
+
+    __slots__ = ("level", "module", "_scope")
+
+    def __init__(
+        self, level: Optional[Level | str] = None, module: Optional[str] = None
+    ) -> None:
+        if isinstance(level, str):
+            level = Level[level]
+        self.level = level
+        self.module = module
+        self._scope: Dict[Optional[str], bool] = {}
+
+    def _applies(self, module: Optional[str]) -> bool:
+        try:
+            return self._scope[module]
+        except KeyError:
+            pass
+        applies = self._scope[module] = (
+            self.module is None
+            or module == self.module
+            or (module is not None and module.startswith(self.module + "."))
+        )
+        return applies
+
+    @abstractmethod
+    def allow(self, site: Site) -> bool:
+        """
+        Check whether a record of the call site passes the policy.
+        """
+
+    def __call__(self, level: Level, module: Optional[str], site: Site) -> bool:
+        if self.level is not None and level > self.level:
+            return True
+        if not self._applies(module):
+            return True
+        return self.allow(site)
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.{type(self).__name__} level={self.level} module={self.module}>"
+
+
+class Sample(Limit):
+    """
+    Pass records with the given probability.
+
+    Args
+    ----
+        rate (float): Probability of a record to be logged, from 0 to 1.
+
+    Example
+    -------
+        logger.limit(Sample(0.01, level="DEBUG"))
+    """
+
+    __slots__ = ("rate",)
+
+    def __init__(
+        self,
+        rate: float,
+        level: Optional[Level | str] = None,
+        module: Optional[str] = None,
+    ) -> None:
+        super().__init__(level, module)
+        self.rate = rate
+
+    def allow(self, site: Site) -> bool:
+        return random.random() < self.rate
+
+
+class RateLimit(Limit):
+    """
+    Token bucket per call site, a call site is a line of code.
+
+    The bucket is kept as a single theoretical arrival time, so updates need no
+    lock. Under contention a few extra records may pass, never fewer.
+
+    Args
+    ----
+        rate (float): Records per second allowed from one call site.
+        burst (int): Records allowed at once after the call site was idle.
+
+    Example
+    -------
+        logger.limit(RateLimit(100, burst=10, module="worker"))
+    """
+
+    __slots__ = ("rate", "burst", "_interval", "_tolerance", "_arrivals")
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        level: Optional[Level | str] = None,
+        module: Optional[str] = None,
+    ) -> None:
+        if rate <= 0:
+            raise LoggissimoError(f"Rate must be greater than 0, got {rate}")
+
+        super().__init__(level, module)
+        self.rate = rate
+        self.burst = burst
+        self._interval = 1 / rate
+        self._tolerance = self._interval * (burst - 1)
+        self._arrivals: Dict[Site, float] = {}
+
+    def allow(self, site: Site) -> bool:
+        now = time.monotonic()
+        arrival = self._arrivals.get(site, now)
+        if arrival < now:
+            arrival = now
+        if arrival - now > self._tolerance:
+            return False
+        self._arrivals[site] = arrival + self._interval
+        return True
+
+
+class Throttle(Limit):
+    """
+    Pass first records of a call site, then only every Mth one.
+
+    Args
+    ----
+        first (int): Number of records always logged.
+        every (int): Log every Mth record after the first ones, none if 0.
+
+    Example
+    -------
+        logger.limit(Throttle(first=10, every=1000))
+    """
+
+    __slots__ = ("first", "every", "_counters")
+
+    def __init__(
+        self,
+        first: int,
+        every: int = 0,
+        level: Optional[Level | str] = None,
+        module: Optional[str] = None,
+    ) -> None:
+        super().__init__(level, module)
+        self.first = first
+        self.every = every
+        self._counters: Dict[Site, Iterator[int]] = {}
+
+    def allow(self, site: Site) -> bool:
+        try:
+            counter = self._counters[site]
+        except KeyError:
+            counter = self._counters.setdefault(site, count())
+        # next() on itertools.count is atomic, no lock is needed
+        number = next(counter)
+        if number < self.first:
+            return True
+        return self.every > 0 and (number - self.first + 1) % self.every == 0
+
+
+class Suppressed:
+    """
+    Per-thread counters of suppressed records, summed when a summary is due.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.due = time.monotonic() + interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counters: List[Tuple[threading.Thread, Counters]] = []
+        # Counts of finished threads, their counters are dropped on collect
+        self._retired: Counters = {}
+        self._reported: Counters = {}
+
+    def add(self, module: Optional[str], site: Site) -> None:
+        try:
+            counters = self._local.counters
+        except AttributeError:
+            counters = self._local.counters = {}
+            with self._lock:
+                self._counters.append((threading.current_thread(), counters))
+        key = (module, site)
+        counters[key] = counters.get(key, 0) + 1
+
+    def collect(self) -> List[Tuple[Optional[str], Site, int]]:
+        """
+        Get number of records suppressed per call site since the last summary.
+        Returns nothing if other thread is collecting.
+        """
+        if not self._lock.acquire(blocking=False):
+            return []
+        try:
+            self.due = time.monotonic() + self.interval
+            alive = []
+            for thread, counters in self._counters:
+                if thread.is_alive():
+                    alive.append((thread, counters))
+                else:
+                    _merge(self._retired, counters)
+            self._counters = alive
+
+            totals = dict(self._retired)
+            for _, counters in alive:
+                _merge(totals, counters)
+
+            summary = []
+            for key, total in totals.items():
+                suppressed = total - self._reported.get(key, 0)
+                if suppressed:
+                    summary.append((key[0], key[1], suppressed))
+                self._reported[key] = total
+            return summary
+        finally:
+            self._lock.release()
+
+
+def _merge(totals: Counters, counters: Counters) -> None:
+    for key, value in list(counters.items()):
+        totals[key] = totals.get(key, 0) + value
@@ -0,0 +1,69 @@
+import time
+import threading
+
+from weakref import WeakValueDictionary
+from typing import IO, Any, Dict
+
+
+class WriteLock:
+    """
+    Lock serializing writes to one stream, so lines written from many threads never interleave.
+    Counts writes and how often and how long writers waited for each other.
+    """
+
+    __slots__ = ("_lock", "writes", "contended", "wait_ns", "__weakref__")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.contended = 0
+        self.wait_ns = 0
+
+    def write(self, stream: IO, output: str | bytes, flush: bool = False) -> None:
+        lock = self._lock
+        if not lock.acquire(blocking=False):
+            start = time.perf_counter_ns()
+            lock.acquire()
+            # Counters are changed only while the lock is held
+            self.contended += 1
+            self.wait_ns += time.perf_counter_ns() - start
+        try:
+            self.writes += 1
+            stream.write(output)
+            if flush:
+                stream.flush()
+        finally:
+            lock.release()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "writes": self.writes,
+            "contended": self.contended,
+            "contention": self.contended / self.writes if self.writes else 0.0,
+            "wait_seconds": self.wait_ns / 1e9,
+        }
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.WriteLock writes={self.writes} contended={self.contended}>"
+
+
+# Locks live as long as streams using them
+_locks: WeakValueDictionary = WeakValueDictionary()
+_locks_lock = threading.Lock()
+
+
+def write_lock(stream: IO, target: Any) -> WriteLock | None:
+    """
+    Get write lock shared by all streams writing to the target, None for thread-safe streams.
+
+    A stream class declares itself thread-safe with a `thread_safe = True` attribute
+    when its `write` is synchronized internally, e.g. by a queue or its own lock,
+    so the logger writes to it without locking.
+    """
+    if getattr(stream, "thread_safe", False):
+        return None
+    with _locks_lock:
+        lock = _locks.get(target)
+        if lock is None:
+            lock = _locks[target] = WriteLock()
+        return lock
@@ -1,46 +1,164 @@
 import sys
-import inspect
+import time
 import threading
-import multiprocessing
 
-from string import Template
-from datetime import datetime
 from weakref import WeakValueDictionary
-from typing import IO, Callable, Dict, List, Optional, Self, Tuple
-
-from ._style import style
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Final,
+    List,
+    NamedTuple,
+    Optional,
+    Self,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from ._format import compile_format
+from ._style import color_depth
+from ._queue import QueuedStream
+from ._identity import current_identity
+from ._context import EMPTY_EXTRA, Contextualize, Extra, current_extra
+from ._record import LogRecord
+from ._exception import Occurrences, capture
 from .exceptions import LoggissimoError
-from .constants import DEFAULT_FORMAT, DEFAULT_LOGGER_NAME, Level
-from ._utils import print_trace, get_module_combinations
+from .constants import (
+    DEFAULT_FORMAT,
+    DEFAULT_LOGGER_NAME,
+    DEFAULT_SUMMARY_INTERVAL,
+    DEFAULT_TIME_FORMAT,
+    Level,
+    Serializer,
+)
+from ._filter import ModuleFilter
+from ._lock import WriteLock, write_lock
+from ._utils import (
+    Completion,
+    join_messages,
+    print_trace,
+    render_name,
+    stream_target,
+)
+
+if TYPE_CHECKING:
+    from ._limits import Limit, Suppressed
+
+# Level methods compare against plain ints, enum attribute lookup costs more than the whole check.
+_EXCESSIVE: Final[int] = Level.EXCESSIVE.value
+_TRACE: Final[int] = Level.TRACE.value
+_DEBUG: Final[int] = Level.DEBUG.value
+_INFO: Final[int] = Level.INFO.value
+_SUCCESS: Final[int] = Level.SUCCESS.value
+_WARNING: Final[int] = Level.WARNING.value
+_ERROR: Final[int] = Level.ERROR.value
+_CRITICAL: Final[int] = Level.CRITICAL.value
+
+
+class _Stream(NamedTuple):
+    stream: IO
+    format: str
+    level: Level | None
+    serialize: Optional[Serializer] = None
+    modules: Optional[ModuleFilter] = None
+    # Underlying file descriptor or stream id, writes with the same target are coalesced
+    target: Any = None
+    # Stream is flushed right after records of this level and higher
+    flush_level: Optional[Level] = None
+    # Stream is written `LogRecord` objects instead of rendered lines
+    records: bool = False
+    # Serializes writes of streams without a true `thread_safe` attribute, see `write_lock`
+    lock: Optional[WriteLock] = None
+
+
+def _async_streams(streams: Tuple[_Stream, ...]) -> List[Any]:
+    """
+    Get async streams of a stream table, asyncio is not imported until an `AsyncStream` is created.
+    """
+    module = sys.modules.get("loggissimo._async")
+    if module is None:
+        return []
+    return [stream for stream, *_ in streams if isinstance(stream, module.AsyncStream)]
+
+
+_reporting = threading.local()
+
+
+def _report(instance: Any, ex: Exception, frame: Any) -> None:
+    """
+    Log error raised by a logger method to the logger streams.
+    It is printed if the logger has no streams or they fail to write it.
+    """
+    if (
+        isinstance(instance, _Logger)
+        and instance._streams
+        and not getattr(_reporting, "active", False)
+    ):
+        _reporting.active = True
+        try:
+            instance._emit(
+                Level.ERROR,
+                "Loggissimo error: {}",
+                (ex,),
+                {"exc_info": ex},
+                False,
+                EMPTY_EXTRA,
+                frame,
+                frame.f_globals.get("__name__"),
+            )
+            return
+        except Exception:
+            pass
+        finally:
+            _reporting.active = False
+    print_trace(ex)
 
 
 class __LoggerMeta(type):
     _instances: WeakValueDictionary = WeakValueDictionary()
-    lock = multiprocessing.Lock()
+    # Default instance is kept alive, `Logger()` returns the same instance and streams every time
+    _default: Any = None
+    # Guards registry and stream table changes, log calls never take it
+    lock = threading.RLock()
 
     def __call__(cls, name: str = DEFAULT_LOGGER_NAME, *args, **kwargs):
+        instance = cls._instances.get(name)
+        if instance is not None:
+            return instance
 
-        if name not in cls._instances.keys():
-            instance = super().__call__(*args, name=name, **kwargs)
-            cls._instances[name] = instance
+        with cls.lock:
+            instance = cls._instances.get(name)
+            if instance is None:
+                instance = super().__call__(*args, name=name, **kwargs)
+                cls._instances[name] = instance
+                if name == DEFAULT_LOGGER_NAME:
+                    cls._default = instance
             return instance
-        return cls._instances[name]
 
     def __del__(self):
-        for instance in self._instances.values():
-            for stream in instance._streams.values():
-                if stream.name == "<stdout>":
+        for instance in list(self._instances.values()):
+            for entry in instance._streams:
+                if entry.stream.name == "<stdout>":
                     continue
-            stream.close()
+                entry.stream.close()
 
 
 class _Logger(metaclass=__LoggerMeta):
     _level = Level.INFO
-    _modules: Dict[str, Tuple[bool, bool]] = {"__main__": (True, True)}
-    _cached_level: dict = {}
-    _aggregated_streams: Dict[str, Tuple[IO, str, Level | str]] = dict()
+    _filter = ModuleFilter({"__main__": True})
+    # Stream tables are immutable snapshots, changes swap in a new tuple under `lock`
+    _aggregated_streams: Tuple[_Stream, ...] = ()
     _rgb: bool = True
-    _streams: dict = {}
+    # False when the terminal has no colors, tags are only removed then
+    _colorize: bool = True
+    _streams: Tuple[_Stream, ...] = ()
+    _min_level: int = _INFO
+    # Stream table paired with the verdicts cached for it, both are replaced together
+    _table: Tuple[Tuple[_Stream, ...], Dict[Tuple[str, str, Level], bool]] = ((), {})
+    _coalesce: bool = False
 
     def __new__(cls, *args, **kwargs) -> Self:
         return super().__new__(cls)
@@ -49,91 +167,122 @@ class _Logger(metaclass=__LoggerMeta):
         self._name_: str = kwargs.get("name", DEFAULT_LOGGER_NAME)
         self._force_colorize: bool = kwargs.get("force_colorize", False)
         self._format: str = kwargs.get("format", DEFAULT_FORMAT)
-        self._time_format = kwargs.get("time", "%H:%M:%S")  # %Y-%m-%d
+        self._time_format = kwargs.get("time", DEFAULT_TIME_FORMAT)  # %Y-%m-%d
+        self._names: Dict[str, str] = {}
+        self._stats: Dict[str, int] = dict.fromkeys(("records", "renders", "writes"), 0)
+        self._limits: Tuple["Limit", ...] = ()
+        self._suppressed: Optional["Suppressed"] = None
+        self._occurrences = Occurrences()
+        if kwargs.get("enqueue", False):
+            stream = QueuedStream(stream)
         try:
-            self._streams = {stream.name: (stream, self._format, None)}
+            self._streams = (
+                _Stream(
+                    stream,
+                    # Empty format follows `Logger.format` changes
+                    "",
+                    None,
+                    target=stream_target(stream),
+                    flush_level=getattr(stream, "flush_level", None),
+                    records=getattr(stream, "records", False),
+                    lock=write_lock(stream, stream_target(stream)),
+                ),
+            )
         except:
             pass
-        self._proc_name = ""
+        self._invalidate()
 
-    def _check_threading(self) -> bool:
+    def _swap(self, streams: Tuple[_Stream, ...]) -> None:
         """
-        Determine whether the logger is in a thread
+        Replace stream table with a new snapshot, must be called under `lock`.
+        Log calls keep iterating the snapshot they have already read.
         """
-        _threading = False
-        if multiprocessing.current_process().name != "MainProcess":
-            _threading = True
-            self._proc_name = multiprocessing.current_process().name
+        self._streams = streams
+        self._invalidate()
 
-        if threading.current_thread().name != "MainThread":
-            _threading = True
-            self._proc_name = threading.current_thread().name
+    @staticmethod
+    def _with_stream(
+        streams: Tuple[_Stream, ...], entry: _Stream
+    ) -> Tuple[_Stream, ...]:
+        """
+        Get copy of stream table with the entry added or replacing the stream of the same name.
+        """
+        name = entry.stream.name
+        for index, current in enumerate(streams):
+            if current.stream.name == name:
+                return streams[:index] + (entry,) + streams[index + 1 :]
+        return streams + (entry,)
 
-        return _threading
+    @staticmethod
+    def _without_stream(
+        streams: Tuple[_Stream, ...], name: str
+    ) -> Tuple[_Stream, ...]:
+        return tuple(entry for entry in streams if entry.stream.name != name)
 
-    def _is_enabled(self, stream, level: Level | None, module: str) -> bool:
+    def _invalidate(self) -> None:
         """
-        Checking logging capability
+        Drop cached verdicts and recalculate the lowest level enabled on any instance stream.
+        Must be called after every change of streams, levels or module rules.
         """
-        if level is None:
-            level = _Logger._level
-        try:
-            cached_level = _Logger._cached_level[(stream, level)]
-        except KeyError:
-            _Logger._cached_level[(stream, level)] = self._valid_log_level(
-                stream, level
-            )
-            cached_level = _Logger._cached_level[(stream, level)]
+        streams = self._streams
+        self._table = (streams, {})
+        targets = [entry.target for entry in streams]
+        self._coalesce = len(set(targets)) < len(targets)
+        self._min_level = min(
+            (
+                _Logger._level if entry.level is None else entry.level
+                for entry in streams
+            ),
+            default=_Logger._level,
+        )
+
+    def _is_enabled(
+        self, entry: "_Stream", level: Level, module: str, verdicts: Dict
+    ) -> bool:
+        """
+        Checking logging capability, verdicts are cached per stream, module and level
+        until streams, levels or module rules change. Verdicts must be the dict paired
+        with the stream table the entry was read from, so a call still iterating a
+        replaced table never caches its verdicts for the new one.
+        """
+        key = (entry.stream.name, module, level)
         try:
-            is_module, cached_module = _Logger._modules[module]
-            return cached_level and cached_module
+            return verdicts[key]
         except KeyError:
-            modules: List[str] = get_module_combinations(module)
-            for mod in modules:
-                is_module, cached_module = _Logger._modules.get(mod, (False, None))  # type: ignore
-                if cached_module is not None:
-                    return cached_module and cached_level
-                _Logger._modules[mod] = (is_module, True)
-                cached_module = True
-        return cached_level and cached_module
-
-    def _valid_log_level(self, stream, level: Level | None):
-        if self._streams[stream.name][2] is None:
-            return level >= _Logger._level
-        return level >= self._streams[stream.name][2]
+            pass
+
+        stream_level = _Logger._level if entry.level is None else entry.level
+        enabled = (
+            level >= stream_level
+            and _Logger._filter(module)
+            and (entry.modules is None or entry.modules(module))
+        )
+        verdicts[key] = enabled
+        return enabled
 
     @staticmethod
     def _catch(func: Callable):
+        # `_log` is called by level methods, other methods are called by the user directly
+        depth = 2 if func.__name__ == "_log" else 1
+
         def _decorator(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as ex:
-                print_trace(ex)
+                _report(args[0] if args else None, ex, sys._getframe(depth))
 
         return _decorator
 
-    def _log(self, level: Level, message: str) -> str:
-        def colorize(do_not_colorize: bool, format_: str):
-            msg_t = style(
-                format_ if format_ else self._format,
-                level,
-                not _Logger._rgb,
-                do_not_colorize,
-            )
-
-            return (
-                Template(msg_t).safe_substitute(
-                    name=f"{name:30}",
-                    time=f"{time}",
-                    level=f"{level.name:<9}",
-                    stack=f"{stack}",
-                    text=f"{message}",
-                )
-                + "\n"
-            )
-
-        self.in_thread = self._check_threading()
-        time_now = datetime.now()
+    @_catch
+    def _log(
+        self,
+        level: Level,
+        message: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        lazy: bool = False,
+        bound: Extra = EMPTY_EXTRA,
+    ) -> str:
         frame = sys._getframe(3)
 
         try:
@@ -141,60 +290,199 @@ class _Logger(metaclass=__LoggerMeta):
         except KeyError:
             module = None
 
-        formatted_time = time_now.strftime(self._time_format)
-        time = formatted_time
-
-        stack = f"{module.replace('.', '/')}:{frame.f_lineno} {frame.f_code.co_name}"
-        name = (
-            f"{self._name_:8} {f'({self._proc_name})':8}"
-            if self._proc_name
-            else f"{self._name_:12}"
-        )
-        name = name if self._name_ != DEFAULT_LOGGER_NAME else ""
-
-        if not self._streams:
+        streams, verdicts = self._table
+        if self._limits and streams:
+            if not any(
+                self._is_enabled(entry, level, module, verdicts) for entry in streams
+            ):
+                return message
+            suppressed: "Suppressed" = self._suppressed  # type: ignore
+            if time.monotonic() >= suppressed.due:
+                self._summarize(frame, module)
+            site = (frame.f_code, frame.f_lineno)
+            for limit in self._limits:
+                if not limit(level, module, site):
+                    suppressed.add(module, site)
+                    return message
+
+        return self._emit(level, message, args, kwargs, lazy, bound, frame, module)
+
+    def _emit(
+        self,
+        level: Level,
+        message: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        lazy: bool,
+        bound: Extra,
+        frame: Any,
+        module: Optional[str],
+    ) -> str:
+        streams, verdicts = self._table
+        if not streams:
             raise LoggissimoError(
                 "No streams found. It could have happened that you cleared the list of streams and then did not add a stream."
             )
 
-        for stream, stream_format, stream_level in self._streams.values():
-            colorize_ = True
-            enabled = self._is_enabled(stream, level, module)
-            if not enabled:
+        stats = self._stats
+        stats["records"] += 1
+
+        exc_info = kwargs.pop("exc_info", None) if kwargs else None
+        record: Optional[LogRecord] = None
+        rendered: Dict[Any, str | bytes] = {}
+        pending: Optional[Dict[Any, List[Any]]] = {} if self._coalesce else None
+        for entry in streams:
+            if not self._is_enabled(entry, level, module, verdicts):
                 continue
-            if self._force_colorize or stream.name == "<stdout>":
-                colorize_ = False
-            stream.write(colorize(colorize_, stream_format))
+            if record is None:
+                record = LogRecord(
+                    self._name_,
+                    level,
+                    time.time_ns(),
+                    time.monotonic_ns(),
+                    module,
+                    frame.f_code,
+                    frame.f_lineno,
+                    current_identity(),
+                    message,
+                    args,
+                    kwargs,
+                    lazy,
+                    current_extra(bound),
+                    capture(exc_info, self._occurrences) if exc_info else None,
+                )
 
-        return message
+            if entry.records:
+                if entry.lock is None:
+                    entry.stream.write(record)
+                else:
+                    entry.lock.write(entry.stream, record)  # type: ignore
+                stats["writes"] += 1
+                continue
 
-    def _change_module_status(
-        self, module: Optional[str], action: bool, path: str = ""
-    ):
-        if module in _Logger._modules.keys():
-            _Logger._modules[module] = (_Logger._modules[module][0], action)
+            if entry.serialize is not None:
+                key: Any = entry.serialize
+                output = rendered.get(key)
+                if output is None:
+                    from ._serialize import SERIALIZERS
+
+                    output = rendered[key] = SERIALIZERS[key](record)
+                    stats["renders"] += 1
+            else:
+                key = compile_format(
+                    entry.format if entry.format else self._format,
+                    level,
+                    not _Logger._rgb,
+                    not _Logger._colorize
+                    or not (self._force_colorize or entry.stream.name == "<stdout>"),
+                )
+                output = rendered.get(key)
+                if output is None:
+                    output = rendered[key] = self._render(key, record)
+                    stats["renders"] += 1
+
+            flush = entry.flush_level is not None and level >= entry.flush_level
+            if pending is None:
+                if entry.lock is None:
+                    entry.stream.write(output)
+                    if flush:
+                        entry.stream.flush()
+                else:
+                    entry.lock.write(entry.stream, output, flush)
+                stats["writes"] += 1
+            else:
+                # Only streams of the same kind share a write, e.g. a text and
+                # a binary stream on one descriptor are written separately
+                group = (
+                    entry.target,
+                    type(entry.stream),
+                    getattr(entry.stream, "encoding", None),
+                )
+                batch = pending.get(group)
+                if batch is None:
+                    pending[group] = [entry, [output], flush]
+                else:
+                    batch[1].append(output)
+                    batch[2] = batch[2] or flush
+
+        if pending:
+            for entry, outputs, flush in pending.values():
+                output = join_messages(outputs)
+                if entry.lock is None:
+                    entry.stream.write(output)
+                    if flush:
+                        entry.stream.flush()
+                else:
+                    entry.lock.write(entry.stream, output, flush)
+                stats["writes"] += 1
+
+        return message if record is None else record.message
+
+    def _render(self, template: str, record: LogRecord) -> str:
+        """
+        Fill compiled format template in, only fields used by the template are rendered.
+        """
+        label = record.identity.label
+        try:
+            name = self._names[label]
+        except KeyError:
+            name = self._names[label] = self._render_name(label)
+
+        line = template.format(
+            name=name,
+            time=(
+                record.formatted_time(self._time_format)
+                if "{time}" in template
+                else ""
+            ),
+            level=record.level.name,
+            stack=record.stack if "{stack}" in template else "",
+            text=record.message,
+            extra=record.extra,
+        )
+        if record.exception is not None:
+            return line + record.exception.text()
+        return line
+
+    def _summarize(self, frame: Any, module: Optional[str]) -> None:
+        """
+        Log number of records suppressed by limits per call site since the last summary.
+        """
+        if self._suppressed is None:
             return
+        for site_module, (code, lineno), suppressed in self._suppressed.collect():
+            self._emit(
+                Level.WARNING,
+                "Suppressed {} messages from {}:{} {}",
+                (suppressed, site_module, lineno, code.co_name),
+                {},
+                False,
+                EMPTY_EXTRA,
+                frame,
+                module,
+            )
+
+    def _render_name(self, label: str) -> str:
+        return render_name(self._name_, label)
 
+    @staticmethod
+    def _change_module_status(module: Optional[str], action: bool) -> None:
         if module:
-            _Logger._modules[module] = (path == "__init__.py", action)
-            return
+            _Logger._filter.set(module, action)
+        else:
+            _Logger._filter.clear()
 
-        _Logger._modules = dict.fromkeys(
-            _Logger._modules.keys(), (path == "__init__.py", action)
-        )
-        return
+        with _Logger.lock:
+            for instance in _Logger._instances.values():
+                instance._invalidate()
 
     def __repr__(self) -> str:
         return f"<loggissimo.logger level={Logger.level} streams={self._streams}>"
 
     def __del__(self) -> None:
-        for stream, format, level in self._streams.values():
-            try:
-                _Logger._aggregated_streams[stream.name]
-                continue
-            except KeyError:
-                pass
-            if stream.name == "<stdout>":
+        aggregated = {entry.stream.name for entry in _Logger._aggregated_streams}
+        for stream, *_ in self._streams:
+            if stream.name in aggregated or stream.name == "<stdout>":
                 continue
             stream.close()
 
@@ -210,8 +498,11 @@ class Logger(_Logger):
             **kwargs,
         )
 
-        for stream, format, stream_level in _Logger._aggregated_streams.values():
-            self.add(stream, format, stream_level)
+        with _Logger.lock:
+            streams = self._streams
+            for entry in _Logger._aggregated_streams:
+                streams = self._with_stream(streams, entry)
+            self._swap(streams)
 
         if isinstance(level, str):
             level = Level[level]
@@ -225,12 +516,15 @@ class Logger(_Logger):
 
     @level.setter
     def level(self, level: Level | str) -> None:
-        if hasattr(self, "_cached_level"):
-            _Logger._cached_level.clear()
         if isinstance(level, str):
             level = Level[level]
         _Logger._level = level
 
+        with _Logger.lock:
+            self._invalidate()
+            for instance in _Logger._instances.values():
+                instance._invalidate()
+
     @property
     def format(self) -> str:
         return self._format
@@ -244,62 +538,240 @@ class Logger(_Logger):
         return _Logger._rgb
 
     @rgb.setter
-    def rgb(self, value: bool) -> None:
-        _Logger._rgb = value
+    def rgb(self, value: Optional[bool]) -> None:
+        """
+        Use rgb colors, basic colors if False, None picks them by the terminal color depth.
+        Terminals with 256 colors get basic colors, terminals without colors get none.
+        """
+        if value is None:
+            depth = color_depth()
+            _Logger._rgb = depth >= 24
+            _Logger._colorize = depth > 0
+        else:
+            _Logger._rgb = value
+            _Logger._colorize = True
 
     def enable(self, module: Optional[str] = None) -> None:
+        """
+        Enable messages from module and its submodules.
+
+        Args
+        ----
+            module (str | None): Module name or wildcard like `"plugins.*"`, all modules if None.
+        """
         self._change_module_status(module, True)
 
-    def disable(self) -> None:
-        frame = inspect.stack()[1]
-        module = inspect.getmodule(frame[0])
+    def disable(self, module: Optional[str] = None) -> None:
+        """
+        Disable messages from module and its submodules.
 
-        if not module:
+        Args
+        ----
+            module (str | None): Module name or wildcard like `"plugins.*"`, calling module if None.
+        """
+        if module:
+            self._change_module_status(module, False)
             return
-        path = module.__file__
 
-        if not path:
+        caller_globals = sys._getframe(1).f_globals
+        if not caller_globals.get("__file__"):
             return
-        file = path.split("/")[-1]
 
-        self._change_module_status(module.__name__, False, path=file)
+        self._change_module_status(caller_globals["__name__"], False)
 
-    @_Logger._catch
-    def info(self, message: str = "") -> str:
-        return self._log(Level.INFO, message)
+    def limit(
+        self, *limits: "Limit", interval: float = DEFAULT_SUMMARY_INTERVAL
+    ) -> None:
+        """
+        Set sampling and rate limiting policies of logger instance, a record is
+        logged only if all of them pass it. Calling without policies removes them.
+        Number of suppressed records per call site is logged as a warning at most
+        once per interval and on `complete()`.
 
-    @_Logger._catch
-    def debug(self, message: str = "") -> str:
-        return self._log(Level.DEBUG, message)
+        Args
+        ----
+            limits (Limit): Policies like `Sample`, `RateLimit` or `Throttle`.
+            interval (float): Seconds between summaries of suppressed records.
 
-    @_Logger._catch
-    def trace(self, message: str = "") -> str:
-        return self._log(Level.TRACE, message)
+        Example
+        -------
+            logger.limit(Sample(0.01, level="DEBUG"), RateLimit(100, module="worker"))
+        """
+        from ._limits import Suppressed
 
-    @_Logger._catch
-    def success(self, message: str = "") -> str:
-        return self._log(Level.SUCCESS, message)
+        self._suppressed = Suppressed(interval)
+        self._limits = limits
 
-    @_Logger._catch
-    def warning(self, message: str = "") -> str:
-        return self._log(Level.WARNING, message)
+    def opt(self, lazy: bool = False) -> "_LoggerView":
+        """
+        Get logger view with changed logging options.
 
-    @_Logger._catch
-    def error(self, message: str = "") -> str:
-        return self._log(Level.ERROR, message)
+        Args
+        ----
+            lazy (bool): Call callable message arguments only if the message is going to be logged.
 
-    @_Logger._catch
-    def critical(self, message: str = "") -> str:
-        return self._log(Level.CRITICAL, message)
+        Example
+        -------
+            logger.opt(lazy=True).debug("State: {}", lambda: dump(state))
+        """
+        return _LoggerView(self, lazy)
 
-    @_Logger._catch
-    def excessive(self, message: str = "") -> str:
-        return self._log(Level.EXCESSIVE, message)
+    def bind(self, **extra: Any) -> "_LoggerView":
+        """
+        Get logger view adding extra fields to its records.
+        Fields are available in formats as `$key` or `$extra[key]`.
+
+        Example
+        -------
+            log = logger.bind(request_id=request.id)
+            log.info("Request handled")
+        """
+        return _LoggerView(self, False, Extra(extra))
+
+    def contextualize(self, **extra: Any) -> Contextualize:
+        """
+        Add extra fields to all records logged in the context of the with block.
+
+        Example
+        -------
+            with logger.contextualize(request_id=request.id):
+                handle(request)
+        """
+        return Contextualize(extra)
+
+    def info(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _INFO:
+            return message
+        return self._log(Level.INFO, message, args, kwargs)
+
+    def debug(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _DEBUG:
+            return message
+        return self._log(Level.DEBUG, message, args, kwargs)
+
+    def trace(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _TRACE:
+            return message
+        return self._log(Level.TRACE, message, args, kwargs)
+
+    def success(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _SUCCESS:
+            return message
+        return self._log(Level.SUCCESS, message, args, kwargs)
+
+    def warning(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _WARNING:
+            return message
+        return self._log(Level.WARNING, message, args, kwargs)
+
+    def error(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _ERROR:
+            return message
+        return self._log(Level.ERROR, message, args, kwargs)
+
+    def critical(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _CRITICAL:
+            return message
+        return self._log(Level.CRITICAL, message, args, kwargs)
+
+    def excessive(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _EXCESSIVE:
+            return message
+        return self._log(Level.EXCESSIVE, message, args, kwargs)
+
+    def exception(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        """
+        Log error with the exception being handled. Other level methods take the exception
+        as `exc_info` keyword: True, an exception or a `sys.exc_info()` tuple.
+        Streams render the traceback themselves, a traceback the logger repeats from
+        the same lines within a minute is rendered as one line with its occurrence count.
+
+        Example
+        -------
+            try:
+                connect()
+            except ConnectionError:
+                logger.exception("Connection failed")
+            logger.warning("Retrying", exc_info=error)
+        """
+        if self._min_level > _ERROR:
+            return message
+        kwargs.setdefault("exc_info", True)
+        return self._log(Level.ERROR, message, args, kwargs)
+
+    async def _backpressure(self) -> None:
+        """
+        Wait until async streams of logger instance have room in their queues.
+        """
+        for stream in _async_streams(self._streams):
+            await stream.wait()
+
+    async def ainfo(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _INFO:
+            return message
+        message = self._log(Level.INFO, message, args, kwargs)
+        await self._backpressure()
+        return message
+
+    async def adebug(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _DEBUG:
+            return message
+        message = self._log(Level.DEBUG, message, args, kwargs)
+        await self._backpressure()
+        return message
+
+    async def atrace(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _TRACE:
+            return message
+        message = self._log(Level.TRACE, message, args, kwargs)
+        await self._backpressure()
+        return message
+
+    async def asuccess(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _SUCCESS:
+            return message
+        message = self._log(Level.SUCCESS, message, args, kwargs)
+        await self._backpressure()
+        return message
+
+    async def awarning(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _WARNING:
+            return message
+        message = self._log(Level.WARNING, message, args, kwargs)
+        await self._backpressure()
+        return message
+
+    async def aerror(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _ERROR:
+            return message
+        message = self._log(Level.ERROR, message, args, kwargs)
+        await self._backpressure()
+        return message
+
+    async def acritical(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _CRITICAL:
+            return message
+        message = self._log(Level.CRITICAL, message, args, kwargs)
+        await self._backpressure()
+        return message
+
+    async def aexcessive(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        if self._min_level > _EXCESSIVE:
+            return message
+        message = self._log(Level.EXCESSIVE, message, args, kwargs)
+        await self._backpressure()
+        return message
 
     @classmethod
     @_Logger._catch
     def addall(
-        cls, stream: IO | str, format: str = "", level: Level | str | None = None
+        cls,
+        stream: IO | str,
+        format: str = "",
+        level: Level | str | None = None,
+        enqueue: bool = False,
+        serialize: Serializer | str | None = None,
+        modules: Optional[Dict[str, bool]] = None,
     ) -> None:
         """
         Add stream to ALL logger instances.
@@ -307,27 +779,55 @@ class Logger(_Logger):
         Args
         ----
             stream (IO | str): IO object or filename.
+            enqueue (bool): Write to the stream from a background thread, see `QueuedStream`.
+            serialize (Serializer | str | None): Write structured records instead of formatted lines.
+            modules (Dict[str, bool] | None): Module rules applied to this stream only, see `enable`.
         """
-        if isinstance(stream, str):
-            try:
-                _Logger._aggregated_streams[stream]
-                return
-            except KeyError:
-                stream = open(stream, "w+", buffering=1)
+        if serialize is not None:
+            serialize = Serializer(serialize)
 
         if level is None:
             level = _Logger._level
         elif isinstance(level, str):
             level = Level[level]
 
-        cls._aggregated_streams[stream.name] = (stream, format, level)  # type: ignore
-
-        for instance in cls._instances.values():
-            instance._streams[stream.name] = (stream, format, level)
+        with _Logger.lock:
+            if isinstance(stream, str):
+                if any(
+                    entry.stream.name == stream for entry in _Logger._aggregated_streams
+                ):
+                    return
+                stream = cls._open(stream, serialize)
+
+            if enqueue and not isinstance(stream, QueuedStream):
+                stream = QueuedStream(stream)  # type: ignore
+
+            entry = _Stream(
+                stream,  # type: ignore
+                format,
+                level,  # type: ignore
+                serialize,  # type: ignore
+                ModuleFilter(modules) if modules else None,
+                stream_target(stream),
+                getattr(stream, "flush_level", None),
+                getattr(stream, "records", False),
+                write_lock(stream, stream_target(stream)),  # type: ignore
+            )
+            _Logger._aggregated_streams = cls._with_stream(
+                _Logger._aggregated_streams, entry
+            )
+            for instance in cls._instances.values():
+                instance._swap(instance._with_stream(instance._streams, entry))
 
     @_Logger._catch
     def add(
-        self, stream: IO | str, format: str = "", level: Level | str | None = None
+        self,
+        stream: IO | str,
+        format: str = "",
+        level: Level | str | None = None,
+        enqueue: bool = False,
+        serialize: Serializer | str | None = None,
+        modules: Optional[Dict[str, bool]] = None,
     ) -> None:
         """
         Add stream to logger instance output.
@@ -335,18 +835,94 @@ class Logger(_Logger):
         Args
         ----
             stream (IO | str): IO object or filename.
+            enqueue (bool): Write to the stream from a background thread, see `QueuedStream`.
+            serialize (Serializer | str | None): Write structured records instead of formatted lines,
+                binary records need a stream opened in binary mode.
+            modules (Dict[str, bool] | None): Module rules applied to this stream only, see `enable`.
         """
-        if isinstance(stream, str):
-            if self._streams.get(stream, False):
-                return
-            stream = open(stream, "w+", buffering=1)
+        if serialize is not None:
+            serialize = Serializer(serialize)
 
         if level is None:
             level = self.level
         elif isinstance(level, str):
             level = Level[level]
 
-        self._streams[stream.name] = (stream, format, level)
+        with _Logger.lock:
+            if isinstance(stream, str):
+                if any(entry.stream.name == stream for entry in self._streams):
+                    return
+                stream = self._open(stream, serialize)
+
+            if enqueue and not isinstance(stream, QueuedStream):
+                stream = QueuedStream(stream)  # type: ignore
+
+            entry = _Stream(
+                stream,  # type: ignore
+                format,
+                level,  # type: ignore
+                serialize,  # type: ignore
+                ModuleFilter(modules) if modules else None,
+                stream_target(stream),
+                getattr(stream, "flush_level", None),
+                getattr(stream, "records", False),
+                write_lock(stream, stream_target(stream)),  # type: ignore
+            )
+            self._swap(self._with_stream(self._streams, entry))
+
+    @staticmethod
+    def _open(path: str, serialize: Optional[Serializer]) -> IO:
+        if serialize is Serializer.BINARY:
+            return open(path, "wb", buffering=0)
+        return open(path, "w+", buffering=1)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get rendering statistics of logger instance.
+
+        Returns
+        -------
+            Dict[str, float]: Number of records, renders and stream writes, and renders per record.
+        """
+        stats: Dict[str, float] = dict(self._stats)
+        stats["renders_per_record"] = (
+            stats["renders"] / stats["records"] if stats["records"] else 0.0
+        )
+        return stats
+
+    def contention(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get write lock statistics of logger instance streams, thread-safe streams are not locked.
+
+        Returns
+        -------
+            Dict[str, Dict[str, float]]: Stream name to number of writes, number of writes
+                which waited for the lock, their share and total seconds waited.
+        """
+        return {
+            entry.stream.name: entry.lock.stats()
+            for entry in self._streams
+            if entry.lock is not None
+        }
+
+    @_Logger._catch
+    def complete(self) -> Completion:
+        """
+        Wait until all messages of logger instance are written to its streams.
+        Async streams are drained only if the result is awaited.
+
+        Example
+        -------
+            logger.complete()
+            await logger.complete()
+        """
+        if self._limits:
+            frame = sys._getframe(2)
+            self._summarize(frame, frame.f_globals.get("__name__"))
+        streams = self._streams
+        for stream, *_ in streams:
+            stream.flush()
+        return Completion(_async_streams(streams))
 
     @_Logger._catch
     def remove(self, name: str) -> None:
@@ -361,14 +937,19 @@ class Logger(_Logger):
         ------
             LoggissimoError: Stream not found
         """
-        del self._streams[name]
+        with _Logger.lock:
+            streams = self._without_stream(self._streams, name)
+            if len(streams) == len(self._streams):
+                raise LoggissimoError(f"Stream {name} not found")
+            self._swap(streams)
 
     @_Logger._catch
     def clear(self) -> None:
         """
         Clear logger instance output streams list.
         """
-        self._streams.clear()
+        with _Logger.lock:
+            self._swap(())
 
     @classmethod
     @_Logger._catch
@@ -380,4 +961,85 @@ class Logger(_Logger):
         ----
             name (str): Instance name.
         """
-        del cls._instances[name]
+        with _Logger.lock:
+            del cls._instances[name]
+            if name == DEFAULT_LOGGER_NAME:
+                cls._default = None
+
+
+def _view_method(level: Level) -> Callable[..., str]:
+    def log(self: "_LoggerView", message: str = "", *args: Any, **kwargs: Any) -> str:
+        logger = self._logger
+        if logger._min_level > level:
+            return message
+        return logger._log(level, message, args, kwargs, self._lazy, self._extra)
+
+    log.__name__ = level.name.lower()
+    return log
+
+
+def _view_async_method(level: Level) -> Callable[..., Coroutine[Any, Any, str]]:
+    async def alog(
+        self: "_LoggerView", message: str = "", *args: Any, **kwargs: Any
+    ) -> str:
+        logger = self._logger
+        if logger._min_level > level:
+            return message
+        message = logger._log(level, message, args, kwargs, self._lazy, self._extra)
+        await logger._backpressure()
+        return message
+
+    alog.__name__ = f"a{level.name.lower()}"
+    return alog
+
+
+class _LoggerView:
+    """
+    Lightweight logger view with its own logging options, streams and formats are shared with the logger.
+    """
+
+    __slots__ = ("_logger", "_lazy", "_extra")
+
+    def __init__(
+        self, logger: Logger, lazy: bool = False, extra: Extra = EMPTY_EXTRA
+    ) -> None:
+        self._logger = logger
+        self._lazy = lazy
+        self._extra = extra
+
+    def opt(self, lazy: bool = False) -> "_LoggerView":
+        return _LoggerView(self._logger, lazy, self._extra)
+
+    def bind(self, **extra: Any) -> "_LoggerView":
+        return _LoggerView(self._logger, self._lazy, Extra(self._extra, **extra))
+
+    def contextualize(self, **extra: Any) -> Contextualize:
+        return Contextualize(extra)
+
+    info = _view_method(Level.INFO)
+    debug = _view_method(Level.DEBUG)
+    trace = _view_method(Level.TRACE)
+    success = _view_method(Level.SUCCESS)
+    warning = _view_method(Level.WARNING)
+    error = _view_method(Level.ERROR)
+    critical = _view_method(Level.CRITICAL)
+    excessive = _view_method(Level.EXCESSIVE)
+
+    def exception(self, message: str = "", *args: Any, **kwargs: Any) -> str:
+        logger = self._logger
+        if logger._min_level > _ERROR:
+            return message
+        kwargs.setdefault("exc_info", True)
+        return logger._log(Level.ERROR, message, args, kwargs, self._lazy, self._extra)
+
+    ainfo = _view_async_method(Level.INFO)
+    adebug = _view_async_method(Level.DEBUG)
+    atrace = _view_async_method(Level.TRACE)
+    asuccess = _view_async_method(Level.SUCCESS)
+    awarning = _view_async_method(Level.WARNING)
+    aerror = _view_async_method(Level.ERROR)
+    acritical = _view_async_method(Level.CRITICAL)
+    aexcessive = _view_async_method(Level.EXCESSIVE)
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.view logger={self._logger._name_} lazy={self._lazy} extra={self._extra}>"
@@ -0,0 +1,173 @@
+import sys
+
+from collections import deque
+from datetime import datetime
+from typing import IO, Iterable, Iterator, List, Optional
+
+from .constants import DEFAULT_FORMAT, DEFAULT_MEMORY_SIZE, DEFAULT_TIME_FORMAT, Level
+from ._format import compile_format
+from ._record import LogRecord
+from ._utils import render_name
+
+
+class MemorySink:
+    """
+    Stream keeping the latest records in memory, records are rendered only on demand.
+
+    It can serve as a flight recorder: when a record of `flight_level` or higher
+    is written, the last `flight` records are dumped to `flight_stream`.
+
+    Args
+    ----
+        size (int): Number of records kept, older records are dropped.
+        format (str): Format records are rendered with.
+        time (str): Time format of rendered records.
+        flight (int): Number of records dumped on errors, nothing is dumped if 0.
+        flight_level (Level | str): Lowest level of records triggering the dump.
+        flight_stream (IO | None): Stream records are dumped to, stderr if None.
+
+    Example
+    -------
+        sink = MemorySink(1000)
+        logger.add(sink, level="DEBUG")
+        assert sink.query(level="ERROR") == []
+    """
+
+    # Logger passes `LogRecord` objects to `write` instead of rendered lines
+    records = True
+    # Deque appends are atomic, the logger does not lock writes
+    thread_safe = True
+
+    def __init__(
+        self,
+        size: int = DEFAULT_MEMORY_SIZE,
+        format: str = DEFAULT_FORMAT,
+        time: str = DEFAULT_TIME_FORMAT,
+        flight: int = 0,
+        flight_level: Level | str = Level.ERROR,
+        flight_stream: Optional[IO] = None,
+    ) -> None:
+        if isinstance(flight_level, str):
+            flight_level = Level[flight_level]
+
+        self.name = f"<memory {id(self):#x}>"
+        self.format = format
+        self.time = time
+        self.flight = flight
+        self.flight_level = flight_level
+        self.flight_stream = flight_stream
+        self._records: deque[LogRecord] = deque(maxlen=size)
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write(self, record: LogRecord) -> int:
+        self._records.append(record)
+        if self.flight and record.level >= self.flight_level:
+            self.dump(self.flight, self.flight_stream)
+        return 1
+
+    def query(
+        self,
+        level: Optional[Level | str] = None,
+        module: Optional[str] = None,
+        since: Optional[datetime | float] = None,
+        until: Optional[datetime | float] = None,
+    ) -> List[LogRecord]:
+        """
+        Get kept records matching all the given conditions, from the oldest to the newest.
+
+        Args
+        ----
+            level (Level | str | None): Lowest record level.
+            module (str | None): Module, records of its submodules match too.
+            since (datetime | float | None): Earliest record time, datetime or epoch seconds.
+            until (datetime | float | None): Latest record time, datetime or epoch seconds.
+        """
+        if isinstance(level, str):
+            level = Level[level]
+        since_ns = self._to_ns(since)
+        until_ns = self._to_ns(until)
+        package = f"{module}."
+
+        return [
+            record
+            for record in list(self._records)
+            if (level is None or record.level >= level)
+            and (
+                module is None
+                or record.module == module
+                or (record.module or "").startswith(package)
+            )
+            and (since_ns is None or record.time_ns >= since_ns)
+            and (until_ns is None or record.time_ns <= until_ns)
+        ]
+
+    @staticmethod
+    def _to_ns(moment: Optional[datetime | float]) -> Optional[int]:
+        if moment is None:
+            return None
+        if isinstance(moment, datetime):
+            moment = moment.timestamp()
+        return int(moment * 1e9)
+
+    def render(
+        self, records: Optional[Iterable[LogRecord]] = None, format: str = ""
+    ) -> str:
+        """
+        Render records without colors, all kept records if None.
+
+        Args
+        ----
+            records (Iterable[LogRecord] | None): Records to render, e.g. a result of `query`.
+            format (str): Format overriding the sink format.
+        """
+        if records is None:
+            records = list(self._records)
+
+        lines: List[str] = []
+        for record in records:
+            template = compile_format(format or self.format, record.level, True, True)
+            stack = record.stack if "{stack}" in template else ""
+            lines.append(
+                template.format(
+                    name=render_name(record.name, record.identity.label),
+                    time=record.formatted_time(self.time),
+                    level=record.level.name,
+                    stack=stack,
+                    text=record.message,
+                    extra=record.extra,
+                )
+            )
+            if record.exception is not None:
+                lines.append(record.exception.text())
+        return "".join(lines)
+
+    def dump(self, count: int, stream: Optional[IO] = None) -> None:
+        """
+        Write the last records rendered to the stream, stderr if None.
+        """
+        records = list(self._records)[-count:] if count > 0 else []
+        stream = stream or sys.stderr
+        stream.write(self.render(records))
+        stream.flush()
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._closed = True
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        return iter(list(self._records))
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.MemorySink records={len(self._records)}/{self._records.maxlen}>"
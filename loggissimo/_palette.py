@@ -0,0 +1,132 @@
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
+
+from loggissimo.constants import Level
+from colorcall import Color, FontStyle, rgb, basic
+
+
+level_colors_rgb = {
+    Level.INFO: [(255, 255, 255), (-1, -1, -1)],
+    Level.SUCCESS: [(40, 170, 90), (-1, -1, -1)],
+    Level.WARNING: [(225, 255, 0), (-1, -1, -1)],
+    Level.ERROR: [(255, 50, 50), (-1, -1, -1)],
+    Level.CRITICAL: [
+        (0, 0, 0),
+        (255, 0, 20),
+    ],
+    Level.DEBUG: [(20, 100, 250), (-1, -1, -1)],
+    Level.TRACE: [(1, 210, 255), (-1, -1, -1)],
+    Level.EXCESSIVE: [(100, 50, 255), (-1, -1, -1)],
+}
+
+level_colors_basic = {
+    Level.INFO: [Color.white, Color.default],
+    Level.SUCCESS: [Color.green, Color.default],
+    Level.WARNING: [Color.yellow, Color.default],
+    Level.ERROR: [Color.red, Color.default],
+    Level.CRITICAL: [
+        Color.black,
+        Color.red,
+    ],
+    Level.DEBUG: [Color.blue, Color.default],
+    Level.TRACE: [Color.cyan, Color.default],
+    Level.EXCESSIVE: [Color.purple, Color.default],
+}
+
+# Opening and closing escape sequences
+Escape = Tuple[str, str]
+
+_MARK = "\0"
+
+
+def _escape(callback: Callable, *args, **kwargs) -> Escape:
+    """
+    Split escape sequences colorcall wraps a text with into opening and closing parts.
+    """
+    opening, closing = callback(_MARK, *args, **kwargs).split(_MARK)
+    return opening, closing
+
+
+def _field_escapes(level: Level, basic_colors: bool) -> Dict[str, Escape]:
+    callback: Callable = basic if basic_colors else rgb  # type: ignore
+    level_colors: Dict[Level, list] = (
+        level_colors_basic if basic_colors else level_colors_rgb  # type: ignore
+    )
+    level_escape = _escape(
+        callback,
+        level_colors[level][0],
+        bgcolor=level_colors[level][1],
+        style=FontStyle.bold,
+    )
+    return {
+        "name": _escape(
+            callback,
+            Color.yellow if basic_colors else (255, 208, 5),
+            style=FontStyle.italic,
+        ),
+        "time": _escape(callback, Color.green if basic_colors else (40, 115, 40)),
+        "level": level_escape,
+        "stack": _escape(
+            callback,
+            Color.cyan if basic_colors else (20, 100, 110),
+            style=FontStyle.underline,
+        ),
+        "text": level_escape,
+    }
+
+
+# `(level, basic_colors)` to fields wrapped into their escape sequences
+STYLED: Dict[Tuple[Level, bool], Dict[str, str]] = {
+    (level, basic_colors): {
+        field: f"{opening}${field}{closing}"
+        for field, (opening, closing) in _field_escapes(level, basic_colors).items()
+    }
+    for level in Level
+    for basic_colors in (False, True)
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_tag(tag: str) -> Dict[str, str]:
+    values: Dict[str, str] = dict()
+    for raw_tag in tag.split(" "):
+        key_val = raw_tag.split("=")
+        key = key_val[0].lstrip("<")
+        values[key] = key_val[1].rstrip(">")
+    return values
+
+
+@lru_cache(maxsize=256)
+def tag_escape(tag: str) -> Escape:
+    """
+    Get escape sequences of a `<font=... bg=... style=...>` tag, parsed once per tag.
+    """
+
+    def rgb_str2int(rgb_str: str) -> List[int]:
+        color_rgb_str = rgb_str.split(",")
+        color_rgb = [int(number) for number in color_rgb_str]
+        return color_rgb
+
+    values = _parse_tag(tag)
+    font_color = values.get("font", "")
+    bg_color = values.get("bg", "")
+    font_style = getattr(FontStyle, values.get("style", "default"))
+
+    font = (255, 255, 255)
+    bg = (-1, -1, -1)
+    try:
+        if font_color:
+            font = rgb_str2int(font_color)  # type: ignore
+
+        if bg_color:
+            bg = rgb_str2int(bg_color)  # type: ignore
+
+        return _escape(rgb, font, bg, font_style)
+    except:
+        return _escape(
+            basic,
+            getattr(Color, font_color),
+            getattr(Color, bg_color, Color.default),
+            font_style,
+        )
+
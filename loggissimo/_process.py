@@ -0,0 +1,146 @@
+import os
+import atexit
+import threading
+import multiprocessing
+
+from typing import IO, Any, Dict, List
+
+from ._utils import join_messages, print_trace
+from .constants import DEFAULT_QUEUE_BATCH
+
+
+class ProcessStream:
+    """
+    Stream shared by several processes.
+
+    Messages from every process are sent over a `multiprocessing.Queue` to a
+    listener thread of the process which created the stream. Only that thread
+    owns the underlying stream, so lines from different processes are never
+    interleaved and the file is opened (and truncated) once.
+
+    The stream is inherited by forked children and can be passed to spawned
+    ones as a `Process` argument, then added to their loggers with `add`.
+
+    Args
+    ----
+        stream (IO | str): IO object or filename.
+        batch (int): Maximum number of messages joined into one write.
+        context (str | None): Multiprocessing start method the child processes are created with.
+    """
+
+    thread_safe = True
+
+    def __init__(
+        self,
+        stream: IO | str,
+        batch: int = DEFAULT_QUEUE_BATCH,
+        context: str | None = None,
+    ) -> None:
+        if isinstance(stream, str):
+            stream = open(stream, "w+", buffering=1)
+
+        self.stream: IO | None = stream
+        self.batch = batch
+        self._name: str = stream.name
+        self._owner = os.getpid()
+        self._queue: Any = multiprocessing.get_context(context).Queue()
+        self._flushed: Dict[int, threading.Event] = {}
+        self._completed = False
+        self._listener = threading.Thread(
+            target=self._listen, name=f"loggissimo-listener {self._name}", daemon=True
+        )
+        self._listener.start()
+        atexit.register(self.complete)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"batch": self.batch, "_name": self._name, "_queue": self._queue}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.stream = None
+        self._owner = -1
+        self._completed = False
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def closed(self) -> bool:
+        return self._completed
+
+    @property
+    def is_owner(self) -> bool:
+        return self._owner == os.getpid()
+
+    def write(self, message: str | bytes) -> int:
+        # Listener is gone once the owner completed, it writes synchronously then
+        if self._completed and self.is_owner:
+            return self.stream.write(message)  # type: ignore
+        self._queue.put(message)
+        return len(message)
+
+    def _listen(self) -> None:
+        while True:
+            batch: List[str | bytes] = []
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    self._write(batch)
+                    return
+                if isinstance(item, int):
+                    self._write(batch)
+                    batch = []
+                    self._flushed.pop(item).set()
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch or self._queue.empty():
+                    break
+                item = self._queue.get()
+            self._write(batch)
+
+    def _write(self, batch: List[str | bytes]) -> None:
+        if not batch or self.stream is None:
+            return
+        try:
+            self.stream.write(join_messages(batch))
+            self.stream.flush()
+        except Exception as ex:
+            print_trace(ex)
+
+    def flush(self) -> None:
+        """
+        Wait until messages sent so far by the owner process are written.
+        In other processes only the local queue buffer is flushed.
+        """
+        if not self.is_owner or self._completed:
+            return
+        event = threading.Event()
+        self._flushed[id(event)] = event
+        self._queue.put(id(event))
+        event.wait()
+
+    def complete(self) -> None:
+        """
+        Write all received messages and stop the listener thread.
+        """
+        if not self.is_owner or self._completed:
+            return
+        self._completed = True
+        self._queue.put(None)
+        self._listener.join()
+
+    def close(self) -> None:
+        """
+        Complete and close the stream in the owner process.
+        Other processes keep sending messages until they exit.
+        """
+        if not self.is_owner:
+            return
+        self.complete()
+        atexit.unregister(self.complete)
+        if self.stream is not None:
+            self.stream.close()
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.ProcessStream name={self._name!r} owner={self._owner}>"
@@ -0,0 +1,169 @@
+import os
+import atexit
+import threading
+
+from collections import deque
+from weakref import WeakSet
+from typing import IO, Deque, List
+
+from ._utils import join_messages, print_trace
+from .constants import DEFAULT_QUEUE_BATCH, DEFAULT_QUEUE_SIZE, Overflow
+
+
+class QueuedStream:
+    """
+    Stream wrapper which moves writes off the calling thread.
+
+    Messages are put on a bounded queue and written in batches by a dedicated
+    writer thread. Once completed, the stream falls back to synchronous writes,
+    so messages logged during interpreter shutdown are not lost.
+
+    Args
+    ----
+        stream (IO): Wrapped output stream.
+        size (int): Maximum number of queued messages.
+        overflow (Overflow | str): What to do with a message when the queue is full.
+        batch (int): Maximum number of messages joined into one write.
+    """
+
+    thread_safe = True
+
+    _streams: WeakSet = WeakSet()
+
+    def __init__(
+        self,
+        stream: IO,
+        size: int = DEFAULT_QUEUE_SIZE,
+        overflow: Overflow | str = Overflow.BLOCK,
+        batch: int = DEFAULT_QUEUE_BATCH,
+    ) -> None:
+        self.stream = stream
+        self.size = size
+        self.overflow = Overflow(overflow)
+        self.batch = batch
+        self.dropped = 0
+
+        self._start()
+        QueuedStream._streams.add(self)
+
+    def _start(self) -> None:
+        self._queue: Deque[str | bytes] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._drained = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._completed = False
+        # Set by the writer thread on exit, later messages are written synchronously
+        self._stopped = False
+        self._writer = threading.Thread(
+            target=self._drain, name=f"loggissimo-writer {self.name}", daemon=True
+        )
+        self._writer.start()
+
+    @property
+    def name(self) -> str:
+        return self.stream.name
+
+    @property
+    def closed(self) -> bool:
+        return self.stream.closed
+
+    def write(self, message: str | bytes) -> int:
+        with self._lock:
+            while not self._stopped and len(self._queue) >= self.size:
+                if self.overflow is Overflow.DROP_NEWEST:
+                    self.dropped += 1
+                    return 0
+                if self.overflow is Overflow.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                    break
+                self._not_full.wait()
+
+            # Writer thread may have exited while the producer waited for room
+            if self._stopped:
+                return self.stream.write(message)
+
+            self._queue.append(message)
+            self._not_empty.notify()
+        return len(message)
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._completed:
+                    self._not_empty.wait()
+                if not self._queue:
+                    self._stopped = True
+                    self._not_full.notify_all()
+                    return
+                batch: List[str | bytes] = [
+                    self._queue.popleft()
+                    for _ in range(min(self.batch, len(self._queue)))
+                ]
+                self._in_flight = len(batch)
+                self._not_full.notify_all()
+
+            try:
+                self.stream.write(join_messages(batch))
+                self.stream.flush()
+            except Exception as ex:
+                print_trace(ex)
+            finally:
+                with self._lock:
+                    self._in_flight = 0
+                    self._drained.notify_all()
+
+    def flush(self) -> None:
+        """
+        Wait until all queued messages are written.
+        """
+        with self._lock:
+            while (self._queue or self._in_flight) and self._writer.is_alive():
+                self._drained.wait()
+        self.stream.flush()
+
+    def complete(self) -> None:
+        """
+        Write all queued messages and stop the writer thread.
+        """
+        with self._lock:
+            if self._completed:
+                return
+            self._completed = True
+            self._not_empty.notify()
+        if self._writer is not threading.current_thread():
+            self._writer.join()
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.complete()
+        self.stream.close()
+
+    def _after_fork(self) -> None:
+        """
+        Writer thread doesn't survive fork, child starts its own with an empty queue.
+        """
+        if not self._completed:
+            self._start()
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.QueuedStream name={self.name!r} queued={len(self._queue)} dropped={self.dropped}>"
+
+
+def _complete_all() -> None:
+    for stream in list(QueuedStream._streams):
+        stream.complete()
+
+
+atexit.register(_complete_all)
+
+
+def _after_fork_in_child() -> None:
+    for stream in list(QueuedStream._streams):
+        stream._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,168 @@
+from types import CodeType
+from typing import Any, Dict, Optional, Tuple
+
+from .constants import Level
+from ._context import Extra
+from ._exception import ExceptionInfo
+from ._identity import Identity
+from ._time import format_time
+from ._utils import caller_stack
+
+
+class LogRecord:
+    """
+    Log record passed through the whole pipeline, it keeps raw values of a log call.
+    Derived fields like the message or the caller stack are rendered on first access
+    and memoized, so every stream pays only for the fields it uses.
+    """
+
+    __slots__ = (
+        "name",
+        "level",
+        "time_ns",
+        "monotonic_ns",
+        "module",
+        "code",
+        "lineno",
+        "identity",
+        "template",
+        "args",
+        "kwargs",
+        "lazy",
+        "extra",
+        "exception",
+        "_message",
+        "_time_format",
+        "_time",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        level: Level,
+        time_ns: int,
+        monotonic_ns: int,
+        module: Optional[str],
+        code: CodeType,
+        lineno: int,
+        identity: Identity,
+        template: str,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        lazy: bool = False,
+        extra: Optional[Extra] = None,
+        exception: Optional[ExceptionInfo] = None,
+    ) -> None:
+        self.name = name
+        self.level = level
+        self.time_ns = time_ns
+        self.monotonic_ns = monotonic_ns
+        self.module = module
+        self.code = code
+        self.lineno = lineno
+        self.identity = identity
+        self.template = template
+        self.args = args
+        self.kwargs = kwargs
+        self.lazy = lazy
+        self.extra = extra if extra is not None else Extra()
+        self.exception = exception
+        self._message: Optional[str] = None
+        self._time_format: Optional[str] = None
+        self._time = ""
+
+    @property
+    def message(self) -> str:
+        """
+        Message template interpolated with the call arguments, callables are evaluated in lazy mode.
+        """
+        message = self._message
+        if message is not None:
+            return message
+
+        args, kwargs = self.args, self.kwargs
+        if not args and not kwargs:
+            message = self.template
+        else:
+            if self.lazy:
+                args = tuple(arg() if callable(arg) else arg for arg in args)
+                kwargs = {
+                    key: value() if callable(value) else value
+                    for key, value in (kwargs or {}).items()
+                }
+            message = self.template.format(*args, **(kwargs or {}))
+        self._message = message
+        # Logged objects are not needed any more, records kept by sinks do not keep them alive
+        self.args = ()
+        self.kwargs = None
+        return message
+
+    def formatted_time(self, time_format: str) -> str:
+        """
+        Record time in the given format, the last formatted value is memoized.
+        """
+        if time_format != self._time_format:
+            self._time = format_time(self.time_ns, time_format, self.monotonic_ns)
+            self._time_format = time_format
+        return self._time
+
+    @property
+    def time(self) -> float:
+        return self.time_ns / 1e9
+
+    @property
+    def monotonic(self) -> float:
+        return self.monotonic_ns / 1e9
+
+    @property
+    def function(self) -> str:
+        return self.code.co_name
+
+    @property
+    def stack(self) -> str:
+        return caller_stack(self.code, self.lineno, self.module)
+
+    @property
+    def process(self) -> int:
+        return self.identity.process
+
+    @property
+    def process_name(self) -> str:
+        return self.identity.process_name
+
+    @property
+    def thread(self) -> int:
+        return self.identity.thread
+
+    @property
+    def thread_name(self) -> str:
+        return self.identity.thread_name
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get record fields written by serializing streams.
+        """
+        from datetime import datetime
+
+        identity = self.identity
+        return {
+            "name": self.name,
+            "level": self.level.name,
+            "levelno": self.level.value,
+            "time": self.time,
+            "time_iso": datetime.fromtimestamp(self.time).astimezone().isoformat(),
+            "monotonic": self.monotonic,
+            "module": self.module,
+            "line": self.lineno,
+            "function": self.code.co_name,
+            "process": identity.process,
+            "process_name": identity.process_name,
+            "thread": identity.thread,
+            "thread_name": identity.thread_name,
+            "message": self.message,
+            "extra": dict(self.extra),
+            "exception": self.exception.to_dict() if self.exception else None,
+        }
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.LogRecord name={self.name} level={self.level} stack={self.stack!r} message={self.message!r}>"
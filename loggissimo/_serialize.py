@@ -0,0 +1,166 @@
+import json
+import struct
+
+from typing import IO, Any, Callable, Dict, Iterator, List, Tuple
+
+from .constants import Serializer
+from .exceptions import LoggissimoError
+from ._record import LogRecord
+
+_LENGTH = struct.Struct(">I")
+
+
+def to_json(record: LogRecord) -> str:
+    """
+    Serialize record into one line JSON object.
+    """
+    return json.dumps(record.to_dict(), ensure_ascii=False, default=str) + "\n"
+
+
+def to_binary(record: LogRecord) -> bytes:
+    """
+    Serialize record into length-prefixed MessagePack-compatible map.
+    """
+    body = b"".join(_pack(record.to_dict()))
+    return _LENGTH.pack(len(body)) + body
+
+
+SERIALIZERS: Dict[Serializer, Callable[[LogRecord], str | bytes]] = {
+    Serializer.JSON: to_json,
+    Serializer.BINARY: to_binary,
+}
+
+
+def read_binary(stream: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    """
+    Read records written by a `Serializer.BINARY` stream.
+
+    Args
+    ----
+        stream (IO[bytes]): Binary file opened for reading.
+    """
+    while True:
+        header = stream.read(_LENGTH.size)
+        if len(header) < _LENGTH.size:
+            return
+        (length,) = _LENGTH.unpack(header)
+        body = stream.read(length)
+        if len(body) < length:
+            raise LoggissimoError("Truncated binary record")
+        record, _ = _unpack(body, 0)
+        yield record
+
+
+def _pack(obj: Any) -> List[bytes]:
+    if obj is None:
+        return [b"\xc0"]
+    if obj is True:
+        return [b"\xc3"]
+    if obj is False:
+        return [b"\xc2"]
+    if isinstance(obj, int):
+        if 0 <= obj < 0x80 or -0x20 <= obj < 0:
+            return [struct.pack(">b", obj) if obj < 0 else struct.pack(">B", obj)]
+        if -(2**63) <= obj < 2**63:
+            return [b"\xd3", struct.pack(">q", obj)]
+        if 0 <= obj < 2**64:
+            return [b"\xcf", struct.pack(">Q", obj)]
+        # Integers out of 64-bit range are written as strings
+    if isinstance(obj, float):
+        return [b"\xcb", struct.pack(">d", obj)]
+    if isinstance(obj, bytes):
+        return [_header(len(obj), None, b"\xc4", b"\xc5", b"\xc6"), obj]
+    if isinstance(obj, (list, tuple)):
+        packed = [_header(len(obj), 0x90, None, b"\xdc", b"\xdd", 16)]
+        for item in obj:
+            packed.extend(_pack(item))
+        return packed
+    if isinstance(obj, dict):
+        packed = [_header(len(obj), 0x80, None, b"\xde", b"\xdf", 16)]
+        for key, value in obj.items():
+            packed.extend(_pack(str(key)))
+            packed.extend(_pack(value))
+        return packed
+
+    data = str(obj).encode("utf-8")
+    return [_header(len(data), 0xA0, b"\xd9", b"\xda", b"\xdb"), data]
+
+
+def _header(
+    length: int,
+    fixed: int | None,
+    prefix8: bytes | None,
+    prefix16: bytes,
+    prefix32: bytes,
+    fixed_limit: int = 32,
+) -> bytes:
+    if fixed is not None and length < fixed_limit:
+        return bytes((fixed | length,))
+    if prefix8 is not None and length < 0x100:
+        return prefix8 + struct.pack(">B", length)
+    if length < 0x10000:
+        return prefix16 + struct.pack(">H", length)
+    return prefix32 + struct.pack(">I", length)
+
+
+def _unpack(data: bytes, offset: int) -> Tuple[Any, int]:
+    code = data[offset]
+    offset += 1
+
+    if code < 0x80:
+        return code, offset
+    if code >= 0xE0:
+        return code - 0x100, offset
+    if 0xA0 <= code < 0xC0:
+        return _string(data, offset, code & 0x1F)
+    if 0x90 <= code < 0xA0:
+        return _array(data, offset, code & 0x0F)
+    if 0x80 <= code < 0x90:
+        return _map(data, offset, code & 0x0F)
+    if code == 0xC0:
+        return None, offset
+    if code == 0xC2:
+        return False, offset
+    if code == 0xC3:
+        return True, offset
+    if code == 0xCB:
+        return struct.unpack_from(">d", data, offset)[0], offset + 8
+    if code == 0xD3:
+        return struct.unpack_from(">q", data, offset)[0], offset + 8
+    if code == 0xCF:
+        return struct.unpack_from(">Q", data, offset)[0], offset + 8
+
+    sizes = {0xD9: ">B", 0xDA: ">H", 0xDB: ">I", 0xC4: ">B", 0xC5: ">H", 0xC6: ">I"}
+    sizes.update({0xDC: ">H", 0xDD: ">I", 0xDE: ">H", 0xDF: ">I"})
+    if code not in sizes:
+        raise LoggissimoError(f"Unsupported binary record type 0x{code:x}")
+
+    (length,) = struct.unpack_from(sizes[code], data, offset)
+    offset += struct.calcsize(sizes[code])
+    if code in (0xD9, 0xDA, 0xDB):
+        return _string(data, offset, length)
+    if code in (0xC4, 0xC5, 0xC6):
+        return data[offset : offset + length], offset + length
+    if code in (0xDC, 0xDD):
+        return _array(data, offset, length)
+    return _map(data, offset, length)
+
+
+def _string(data: bytes, offset: int, length: int) -> Tuple[str, int]:
+    return data[offset : offset + length].decode("utf-8"), offset + length
+
+
+def _array(data: bytes, offset: int, length: int) -> Tuple[List[Any], int]:
+    items = []
+    for _ in range(length):
+        item, offset = _unpack(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _map(data: bytes, offset: int, length: int) -> Tuple[Dict[str, Any], int]:
+    items = {}
+    for _ in range(length):
+        key, offset = _unpack(data, offset)
+        items[key], offset = _unpack(data, offset)
+    return items, offset
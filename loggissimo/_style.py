@@ -1,38 +1,12 @@
+import os
 import re
+import sys
 from string import Template
-from typing import Callable, Dict, List
+from typing import IO, Optional
 
 from loggissimo.constants import Level
-from colorcall import Color, FontStyle, rgb, basic
 
-
-level_colors_rgb = {
-    Level.INFO: [(255, 255, 255), (-1, -1, -1)],
-    Level.SUCCESS: [(40, 170, 90), (-1, -1, -1)],
-    Level.WARNING: [(225, 255, 0), (-1, -1, -1)],
-    Level.ERROR: [(255, 50, 50), (-1, -1, -1)],
-    Level.CRITICAL: [
-        (0, 0, 0),
-        (255, 0, 20),
-    ],
-    Level.DEBUG: [(20, 100, 250), (-1, -1, -1)],
-    Level.TRACE: [(1, 210, 255), (-1, -1, -1)],
-    Level.EXCESSIVE: [(100, 50, 255), (-1, -1, -1)],
-}
-
-level_colors_basic = {
-    Level.INFO: [Color.white, Color.default],
-    Level.SUCCESS: [Color.green, Color.default],
-    Level.WARNING: [Color.yellow, Color.default],
-    Level.ERROR: [Color.red, Color.default],
-    Level.CRITICAL: [
-        Color.black,
-        Color.red,
-    ],
-    Level.DEBUG: [Color.blue, Color.default],
-    Level.TRACE: [Color.cyan, Color.default],
-    Level.EXCESSIVE: [Color.purple, Color.default],
-}
+TAG = re.compile(r"(\<.*?>).*?(\$\w*)")
 
 
 def style(
@@ -41,94 +15,47 @@ def style(
     basic_colors: bool = False,
     only_remove_tags: bool = False,
 ) -> str:
-    style_format = re.findall(
-        r"(\<.*?>).*?(\$\w*)",
-        format,
-    )
-    callback: Callable = basic if basic_colors else rgb  # type: ignore
-    level_colors: Dict[Level, tuple] = (
-        level_colors_basic if basic_colors else level_colors_rgb  # type: ignore
-    )
-    styled: Dict[str, str] = {
-        "name": callback(
-            "$name",
-            Color.yellow if basic_colors else (255, 208, 5),
-            style=FontStyle.italic,
-        ),
-        "time": callback("$time", Color.green if basic_colors else (40, 115, 40)),
-        "level": callback(
-            "$level",
-            level_colors[level][0],
-            bgcolor=level_colors[level][1],
-            style=FontStyle.bold,
-        ),
-        "stack": callback(
-            "$stack",
-            Color.cyan if basic_colors else (20, 100, 110),
-            style=FontStyle.underline,
-        ),
-        "text": callback(
-            "$text",
-            level_colors[level][0],
-            bgcolor=level_colors[level][1],
-            style=FontStyle.bold,
-        ),
-    }
-
-    for style, value in style_format:
-        format = format.replace(style, "")
-        tag = Tag(style, value)
-        styled[value[1:]] = tag.colorized
-
+    """
+    Colorize format fields, or only remove its tags.
+    Escape sequences come from `_palette`, which is imported with `colorcall` on the first colorized format.
+    """
+    tags = TAG.findall(format)
+    for tag, _ in tags:
+        format = format.replace(tag, "")
     if only_remove_tags:
         return format
 
-    return Template(format).safe_substitute(**styled)
-
+    from ._palette import STYLED, tag_escape
 
-class Tag:
-    def __init__(self, tag: str, text: str, *args, **kwargs) -> None:
-        def rgb_str2int(rgb_str: str) -> List[int]:
-            color_rgb_str = rgb_str.split(",")
-            color_rgb = [int(number) for number in color_rgb_str]
-            return color_rgb
+    styled = STYLED[(level, basic_colors)]
+    if tags:
+        styled = dict(styled)
+        for tag, value in tags:
+            opening, closing = tag_escape(tag)
+            styled[value[1:]] = f"{opening}{value}{closing}"
 
-        self.values: Dict[str, str] = dict()
-        self.text = text
-        if tag:
-            splitted = tag.split(" ")
-            for raw_tag in splitted:
-                key_val = raw_tag.split("=")
-                key = key_val[0].lstrip("<")
-                self.values[key] = key_val[1].rstrip(">")
-
-            self.font_color = self.values.get("font", "")
-            self.bg_color = self.values.get("bg", "")
-            self.style = getattr(FontStyle, self.values.get("style", "default"))
-
-            font = (255, 255, 255)
-            bg = (-1, -1, -1)
-            try:
-                if self.font_color:
-                    font = rgb_str2int(self.font_color)  # type: ignore
-
-                if self.bg_color:
-                    bg = rgb_str2int(self.bg_color)  # type: ignore
-
-                self.colorized = rgb(self.text, font, bg, self.style)
-            except:
-                self.colorized = basic(
-                    self.text,
-                    getattr(Color, self.font_color),
-                    getattr(Color, self.bg_color, Color.default),
-                    self.style,
-                )
+    return Template(format).safe_substitute(**styled)
 
-    def __str__(self) -> str:
-        return self.colorized
 
-    def __repr__(self) -> str:
-        _repr = "<"
-        for key, val in self.values.items():
-            _repr += f"{key}={val} "
-        return _repr.rstrip(" ") + ">"
+def color_depth(stream: Optional[IO] = None) -> int:
+    """
+    Detect number of color bits the terminal supports from the environment.
+
+    Returns
+    -------
+        int: 24 for truecolor terminals, 8 for 256 colors, 4 for basic colors and 0 without colors.
+    """
+    stream = stream or sys.stdout
+    if os.environ.get("NO_COLOR"):
+        return 0
+    # COLORTERM is inherited by child processes, it does not make a pipe a terminal
+    term = os.environ.get("TERM", "")
+    if not getattr(stream, "isatty", lambda: False)() or term == "dumb":
+        return 0
+    if os.environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return 24
+    if "truecolor" in term or "24bit" in term or "direct" in term:
+        return 24
+    if "256" in term:
+        return 8
+    return 4
@@ -0,0 +1,55 @@
+import re
+import threading
+
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from .constants import EPOCH_TIME, MONOTONIC_TIME
+
+_local = threading.local()
+
+
+def format_time(time_ns: int, time_format: str, monotonic_ns: int = 0) -> str:
+    """
+    Format timestamp like `datetime.strftime`, which is called at most once per second, thread and format.
+
+    Microseconds (`%f`) are inserted into the cached parts on every call.
+    `EPOCH_TIME` and `MONOTONIC_TIME` formats render seconds as a float.
+
+    Args
+    ----
+        time_ns (int): Timestamp from `time.time_ns()`.
+        time_format (str): `datetime.strftime` format, `EPOCH_TIME` or `MONOTONIC_TIME`.
+        monotonic_ns (int): Timestamp from `time.monotonic_ns()` taken with `time_ns`.
+    """
+    if time_format == EPOCH_TIME:
+        return f"{time_ns / 1e9:.6f}"
+    if time_format == MONOTONIC_TIME:
+        return f"{monotonic_ns / 1e9:.6f}"
+
+    try:
+        cache: Dict[str, Tuple[int, List[str]]] = _local.cache
+    except AttributeError:
+        cache = _local.cache = {}
+
+    second = time_ns // 1_000_000_000
+    cached = cache.get(time_format)
+    if cached is None or cached[0] != second:
+        now = datetime.fromtimestamp(second)
+        cached = (second, [now.strftime(part) for part in _split(time_format)])
+        cache[time_format] = cached
+
+    parts = cached[1]
+    if len(parts) == 1:
+        return parts[0]
+    return f"{time_ns // 1000 % 1_000_000:06d}".join(parts)
+
+
+def _split(time_format: str) -> List[str]:
+    parts = [""]
+    for token in re.split(r"(%.)", time_format):
+        if token == "%f":
+            parts.append("")
+        else:
+            parts[-1] += token
+    return parts
@@ -1,50 +1,110 @@
-import math
-import shutil
+from types import CodeType
+from functools import lru_cache
+from typing import IO, Any, Dict, Generator, Iterable, Optional, Sequence, Tuple
 
-import traceback
-from typing import List
+from .constants import (
+    DEFAULT_LOGGER_NAME,
+    END_LOGGER_TRACE,
+    START_LOGGER_TRACE,
+    STACK_CACHE_SIZE,
+)
 
-from .constants import END_LOGGER_TRACE, START_LOGGER_TRACE
+_stacks: Dict[Tuple[object, int], str] = {}
 
 
 def print_trace(ex: Exception, advice: str = "", line_char: str = "=") -> None:
-    columns = shutil.get_terminal_size().columns
-
-    half_start_columns = math.ceil((columns - len(START_LOGGER_TRACE)) / 2)
-    half_end_columns = math.ceil((columns - len(END_LOGGER_TRACE)) / 2)
+    import traceback
 
-    start_trace_line = (
-        line_char * half_start_columns
-        + START_LOGGER_TRACE
-        + line_char * half_start_columns
-    )
-    end_trace_line = (
-        line_char * half_end_columns + END_LOGGER_TRACE + line_char * half_end_columns
-    )
+    columns, start_trace_line, end_trace_line = _banners(line_char)
 
-    for _ in range(columns):
-        if len(start_trace_line) > columns:
-            start_trace_line = start_trace_line[:-1]
-        if len(end_trace_line) > columns:
-            end_trace_line = end_trace_line[:-1]
-        if len(end_trace_line) == columns and len(start_trace_line) == columns:
-            break
-
-    print(start_trace_line.center(columns), end="\n\n")
+    print(start_trace_line, end="\n\n")
     traces = traceback.format_tb(ex.__traceback__)
     [print(trace) for trace in traces]
     print(ex)
     print(advice)
-    print(end_trace_line.center(columns))
-
-
-def get_module_combinations(input_string: str) -> List[str]:
-    words = input_string.split(".")
-    combinations = []
-    current = ""
-    for word in words:
-        if current:
-            current += "."
-        current += word
-        combinations.append(current)
-    return combinations
+    print(end_trace_line)
+
+
+@lru_cache(maxsize=8)
+def _banners(line_char: str) -> Tuple[int, str, str]:
+    """
+    Get terminal width and trace banners, computed once per banner character.
+    """
+    import shutil
+
+    columns = shutil.get_terminal_size().columns
+    return (
+        columns,
+        _banner(START_LOGGER_TRACE, columns, line_char),
+        _banner(END_LOGGER_TRACE, columns, line_char),
+    )
+
+
+def _banner(title: str, columns: int, line_char: str) -> str:
+    half = -(-(columns - len(title)) // 2)
+    line = line_char * half + title + line_char * half
+    return line[: max(columns, len(title))].center(columns)
+
+
+def join_messages(messages: Sequence[str | bytes]) -> str | bytes:
+    """
+    Join a batch of text or binary (serialized) messages into one write.
+    """
+    if messages and isinstance(messages[0], bytes):
+        return b"".join(messages)  # type: ignore
+    return "".join(messages)  # type: ignore
+
+
+def caller_stack(code: CodeType, lineno: int, module: Optional[str]) -> str:
+    """
+    Render `module/path:line function` of the call site, cached per code object and line.
+    """
+    key = (code, lineno)
+    try:
+        return _stacks[key]
+    except KeyError:
+        pass
+
+    if len(_stacks) >= STACK_CACHE_SIZE:
+        _stacks.clear()
+    stack = _stacks[key] = f"{str(module).replace('.', '/')}:{lineno} {code.co_name}"
+    return stack
+
+
+def render_name(name: str, label: str) -> str:
+    """
+    Render logger name with the process or thread label for the `$name` field.
+    """
+    if name == DEFAULT_LOGGER_NAME:
+        return ""
+    if label:
+        return f"{name:8} {f'({label})':8}"
+    return f"{name:12}"
+
+
+class Completion:
+    """
+    Result of `Logger.complete()`, awaiting it also drains async streams.
+    """
+
+    __slots__ = ("_streams",)
+
+    def __init__(self, streams: Iterable[Any]) -> None:
+        self._streams = list(streams)
+
+    async def _complete(self) -> None:
+        for stream in self._streams:
+            await stream.complete()
+
+    def __await__(self) -> Generator:
+        return self._complete().__await__()
+
+
+def stream_target(stream: IO) -> Any:
+    """
+    Identify where the stream writes to, its file descriptor if it has one.
+    """
+    try:
+        return stream.fileno()
+    except Exception:
+        return id(stream)
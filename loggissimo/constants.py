@@ -1,5 +1,5 @@
 from typing import Final
-from enum import IntEnum
+from enum import Enum, IntEnum
 
 DEFAULT_LOGGER_NAME: Final[str] = "default"
 
@@ -8,6 +8,27 @@ END_LOGGER_TRACE: Final[str] = "[End Loggissimo Trace]"
 
 DEFAULT_FORMAT: Final[str] = "$name@ $time |$level| $stack: $text"
 
+DEFAULT_TIME_FORMAT: Final[str] = "%H:%M:%S"
+EPOCH_TIME: Final[str] = "epoch"
+MONOTONIC_TIME: Final[str] = "monotonic"
+
+DEFAULT_BUFFER_SIZE: Final[int] = 64 * 1024
+DEFAULT_BUFFER_INTERVAL: Final[float] = 1.0
+IOV_MAX: Final[int] = 1024
+
+DEFAULT_RING_SIZE: Final[int] = 4 * 1024 * 1024
+
+DEFAULT_MEMORY_SIZE: Final[int] = 10_000
+
+DEFAULT_SUMMARY_INTERVAL: Final[float] = 60.0
+
+STACK_CACHE_SIZE: Final[int] = 10_000
+TRACEBACK_CACHE_SIZE: Final[int] = 1024
+TRACEBACK_WINDOW: Final[float] = 60.0
+
+DEFAULT_QUEUE_SIZE: Final[int] = 10_000
+DEFAULT_QUEUE_BATCH: Final[int] = 512
+
 
 class Level(IntEnum):
     EXCESSIVE = 1
@@ -21,3 +42,28 @@ class Level(IntEnum):
 
     def __str__(self) -> str:
         return self.name
+
+
+class Overflow(str, Enum):
+    """
+    Policy of a queued stream when its queue is full.
+    """
+
+    BLOCK = "block"
+    DROP_NEWEST = "drop-newest"
+    DROP_OLDEST = "drop-oldest"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class Serializer(str, Enum):
+    """
+    Structured output of a stream.
+    """
+
+    JSON = "json"
+    BINARY = "binary"
+
+    def __str__(self) -> str:
+        return self.value
@@ -0,0 +1,214 @@
+"""
+Memory-mapped ring buffer stream.
+
+Records are copied into a fixed-size file mapped into memory, old records are
+overwritten when the buffer wraps. Pages belong to the kernel, so everything
+written before a process crash can still be read back with:
+
+    python -m loggissimo.ring dump <file>
+"""
+
+import os
+import sys
+import mmap
+import zlib
+import struct
+import threading
+
+from typing import Iterator, List, Optional, Tuple
+
+from .constants import DEFAULT_RING_SIZE
+from .exceptions import LoggissimoError
+
+MAGIC = b"LGRB"
+VERSION = 1
+SYNC = 0x5AA5
+
+# magic, version, capacity, write offset, wrap count, next sequence number
+HEADER = struct.Struct("<4sIQQQQ")
+# sync, payload length, payload crc32, sequence number
+RECORD = struct.Struct("<HIIQ")
+
+
+class RingStream:
+    """
+    Stream writing records into a memory-mapped circular file.
+
+    A write is a copy into the mapping, no syscall is made per record. An
+    existing ring file of the same size is continued instead of truncated.
+    The stream is safe to use from several threads of one process.
+
+    Args
+    ----
+        path (str): Ring file path.
+        size (int): Size of the data area in bytes.
+        encoding (str): Encoding of text messages.
+    """
+
+    thread_safe = True
+
+    def __init__(
+        self, path: str, size: int = DEFAULT_RING_SIZE, encoding: str = "utf-8"
+    ) -> None:
+        if size <= RECORD.size:
+            raise LoggissimoError(f"Ring size must be greater than {RECORD.size}")
+
+        self.path = path
+        self.capacity = size
+        self.encoding = encoding
+        self._lock = threading.Lock()
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            existing = os.fstat(fd).st_size
+            if existing != HEADER.size + size:
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, HEADER.size + size)
+            self._map = mmap.mmap(fd, HEADER.size + size)
+        finally:
+            os.close(fd)
+
+        magic, version, capacity, offset, wraps, sequence = HEADER.unpack_from(
+            self._map, 0
+        )
+        if magic == MAGIC and version == VERSION and capacity == size:
+            self._offset, self._wraps, self._sequence = offset, wraps, sequence
+        else:
+            self._offset = self._wraps = self._sequence = 0
+            self._store_header()
+
+    @property
+    def name(self) -> str:
+        return self.path
+
+    @property
+    def closed(self) -> bool:
+        return self._map.closed
+
+    def _store_header(self) -> None:
+        HEADER.pack_into(
+            self._map,
+            0,
+            MAGIC,
+            VERSION,
+            self.capacity,
+            self._offset,
+            self._wraps,
+            self._sequence,
+        )
+
+    def write(self, message: str | bytes) -> int:
+        data = message if isinstance(message, bytes) else message.encode(self.encoding)
+        data = data[: self.capacity - RECORD.size]
+        length = RECORD.size + len(data)
+
+        with self._lock:
+            if self._offset + length > self.capacity:
+                self._map[HEADER.size + self._offset : HEADER.size + self.capacity] = (
+                    bytes(self.capacity - self._offset)
+                )
+                self._offset = 0
+                self._wraps += 1
+
+            position = HEADER.size + self._offset
+            RECORD.pack_into(
+                self._map, position, SYNC, len(data), zlib.crc32(data), self._sequence
+            )
+            self._map[position + RECORD.size : position + length] = data
+            self._offset += length
+            self._sequence += 1
+            self._store_header()
+        return len(message)
+
+    def flush(self) -> None:
+        """
+        Sync mapped pages to the file, needed only to survive a system crash.
+        """
+        with self._lock:
+            self._map.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map.closed:
+                return
+            self._map.flush()
+            self._map.close()
+
+    def __repr__(self) -> str:
+        return f"<loggissimo.RingStream path={self.path!r} offset={self._offset} wraps={self._wraps}>"
+
+
+def _record_at(data: bytes, position: int) -> Optional[Tuple[int, bytes]]:
+    if position + RECORD.size > len(data):
+        return None
+    sync, length, crc, sequence = RECORD.unpack_from(data, position)
+    end = position + RECORD.size + length
+    if sync != SYNC or end > len(data):
+        return None
+    payload = data[position + RECORD.size : end]
+    if zlib.crc32(payload) != crc:
+        return None
+    return sequence, payload
+
+
+def _chain(data: bytes, position: int, end: int) -> List[Tuple[int, bytes]]:
+    records: List[Tuple[int, bytes]] = []
+    while position < end:
+        record = _record_at(data, position)
+        if record is None or (records and record[0] != records[-1][0] + 1):
+            break
+        records.append(record)
+        position += RECORD.size + len(record[1])
+    return records
+
+
+def read_ring(path: str) -> Iterator[bytes]:
+    """
+    Read records of a ring file from the oldest to the newest.
+
+    Args
+    ----
+        path (str): Ring file path.
+    """
+    with open(path, "rb") as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise LoggissimoError(f"{path} is not a loggissimo ring file")
+        magic, version, capacity, offset, wraps, sequence = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise LoggissimoError(f"{path} is not a loggissimo ring file")
+        data = file.read(capacity)
+
+    records: List[Tuple[int, bytes]] = []
+    if wraps:
+        for position in range(offset, capacity):
+            if data[position : position + 2] != SYNC.to_bytes(2, "little"):
+                continue
+            records = _chain(data, position, capacity)
+            if records:
+                break
+    newest = _chain(data, 0, offset)
+
+    if records and newest and records[-1][0] + 1 != newest[0][0]:
+        records = []
+    for sequence, payload in records + newest:
+        yield payload
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m loggissimo.ring")
+    commands = parser.add_subparsers(dest="command", required=True)
+    dump = commands.add_parser("dump", help="print records from the oldest to the newest")
+    dump.add_argument("file", type=str)
+    args = parser.parse_args(argv)
+
+    output = sys.stdout.buffer
+    for payload in read_ring(args.file):
+        output.write(payload if payload.endswith(b"\n") else payload + b"\n")
+    output.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import time
+import asyncio
+
+from typing import List
+
+from loggissimo import AsyncStream, Logger
+
+LINES = 500
+WRITE_DELAY = 0.002
+
+
+class SlowStream:
+    name = "slow-async"
+    closed = False
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+
+    def write(self, message: str) -> int:
+        time.sleep(WRITE_DELAY)
+        self.lines.extend(message.splitlines())
+        return len(message)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+async def measure_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    lag = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = max(lag, time.perf_counter() - start - interval)
+    return lag
+
+
+def test_event_loop_lag():
+    slow = SlowStream()
+    log = Logger("async-lag")
+    log.clear()
+    log.add(AsyncStream(slow), level="INFO")
+
+    async def main() -> float:
+        stop = asyncio.Event()
+        lag = asyncio.create_task(measure_lag(stop))
+        for number in range(LINES):
+            log.info("line {}", number)
+            if number % 50 == 0:
+                await asyncio.sleep(0)
+        await log.complete()
+        stop.set()
+        return await lag
+
+    lag = asyncio.run(main())
+
+    assert len(slow.lines) == LINES
+    assert slow.lines[-1].endswith(f"line {LINES - 1}")
+    assert lag < LINES * WRITE_DELAY / 10
+
+
+def test_backpressure():
+    slow = SlowStream()
+    stream = AsyncStream(slow, size=5, batch=1)
+    log = Logger("async-backpressure")
+    log.clear()
+    log.add(stream, level="INFO")
+
+    async def main() -> int:
+        longest = 0
+        for number in range(20):
+            await log.ainfo("line {}", number)
+            longest = max(longest, len(stream._queue))
+        await log.complete()
+        return longest
+
+    assert asyncio.run(main()) <= 5
+    assert len(slow.lines) == 20
+
+    log.info("outside of loop")
+    assert slow.lines[-1].endswith("outside of loop")
@@ -0,0 +1,71 @@
+import timeit
+import tracemalloc
+
+from loggissimo import Logger
+
+REPEAT = 5
+NUMBER = 100_000
+# Bytes a log call may allocate at peak
+ALLOCATION_BUDGET = 4096
+
+
+class Bare:
+    def debug(self, message: str = "") -> str:
+        return message
+
+
+def best(stmt) -> float:
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def test_disabled_level_cost():
+    log = Logger("bench-disabled")
+    level = log.level
+    log.level = "INFO"
+    try:
+        bare = Bare()
+        disabled = best(lambda: log.debug("debug"))
+        baseline = best(lambda: bare.debug("debug"))
+    finally:
+        log.level = level
+
+    assert (
+        disabled < baseline * 3
+    ), f"disabled: {disabled * 1e9:.0f} ns, bare call: {baseline * 1e9:.0f} ns"
+
+
+class Null:
+    name = "<null>"
+
+    def write(self, message: str) -> int:
+        return len(message)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_record_allocations():
+    log = Logger("bench-allocations")
+    log.add(Null(), level="INFO")
+    for _ in range(10):
+        log.info("warm up {}", 1)
+
+    tracemalloc.start()
+    try:
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        log.info("record {}", 1)
+        peak = tracemalloc.get_traced_memory()[1] - current
+
+        for _ in range(1000):
+            log.info("record {}", 1)
+        retained = tracemalloc.get_traced_memory()[0] - current
+    finally:
+        tracemalloc.stop()
+        log.remove("<null>")
+
+    assert peak < ALLOCATION_BUDGET, f"record peak: {peak} B"
+    assert retained < ALLOCATION_BUDGET, f"retained after 1000 records: {retained} B"
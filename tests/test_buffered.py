@@ -0,0 +1,64 @@
+import os
+import time
+import threading
+
+from loggissimo import BufferedStream, Logger
+from constants import TMP_DIR
+
+THREADS = 8
+LINES = 500
+
+
+def test_buffered_threads():
+    path = f"{TMP_DIR}/buffered.log"
+    stream = BufferedStream(path, size=16 * 1024, interval=60)
+    log = Logger("buffered")
+    log.add(stream, format="$text", level="INFO")
+
+    def target(number: int):
+        for line in range(LINES):
+            log.info("{}-{}", number, line)
+
+    threads = [threading.Thread(target=target, args=(_,)) for _ in range(THREADS)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    log.complete()
+
+    with open(path, "r") as file:
+        lines = file.read().splitlines()
+
+    assert sorted(lines) == sorted(
+        f"{number}-{line}" for number in range(THREADS) for line in range(LINES)
+    )
+    stats = stream.stats()
+    assert stats["lines"] == THREADS * LINES
+    assert stats["lines_per_syscall"] > 10
+
+    log.remove(path)
+    stream.close()
+    os.remove(path)
+
+
+def test_flush_policies():
+    path = f"{TMP_DIR}/buffered_policies.log"
+    stream = BufferedStream(path, interval=0.05)
+    log = Logger("buffered-policies")
+    log.add(stream, format="$text", level="INFO")
+
+    def read() -> list:
+        with open(path, "r") as file:
+            return file.read().splitlines()
+
+    log.info("buffered")
+    assert read() == []
+
+    log.error("error")
+    assert read() == ["buffered", "error"]
+
+    log.info("interval")
+    time.sleep(0.2)
+    assert read() == ["buffered", "error", "interval"]
+
+    log.remove(path)
+    stream.close()
+    os.remove(path)
@@ -0,0 +1,58 @@
+import os
+import re
+import threading
+
+from loggissimo import Logger, MemorySink
+from constants import TMP_DIR
+
+THREADS = 64
+LINES = 200
+
+LINE = re.compile(
+    r"^stress\s+\(Thread-\d+ \(target\)\)\s*@ \d\d:\d\d:\d\d \|INFO     \| "
+    r"test_contention:\d+ target: thread (\d+) line (\d+) payload x{64}$"
+)
+
+
+def test_shared_file_lines():
+    path = f"{TMP_DIR}/contention.log"
+    log = Logger("stress")
+    log.add(path, level="INFO")
+    barrier = threading.Barrier(THREADS)
+
+    def target(number: int):
+        barrier.wait()
+        for line in range(LINES):
+            log.info("thread {} line {} payload {}", number, line, "x" * 64)
+
+    threads = [threading.Thread(target=target, args=(_,)) for _ in range(THREADS)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    log.complete()
+
+    with open(path, "r") as file:
+        lines = file.read().splitlines()
+
+    parsed = set()
+    for line in lines:
+        match = LINE.match(line)
+        assert match, line
+        parsed.add((int(match.group(1)), int(match.group(2))))
+    assert len(lines) == THREADS * LINES
+    assert parsed == {(number, line) for number in range(THREADS) for line in range(LINES)}
+
+    stats = log.contention()[path]
+    assert stats["writes"] >= THREADS * LINES, stats
+    assert 0 <= stats["contention"] <= 1, stats
+
+    log.remove(path)
+    os.remove(path)
+
+
+def test_thread_safe_streams_unlocked():
+    sink = MemorySink()
+    log = Logger("stress_unlocked")
+    log.add(sink)
+
+    assert sink.name not in log.contention()
+    log.remove(sink.name)
@@ -0,0 +1,85 @@
+import os
+import json
+import asyncio
+import threading
+
+from loggissimo import Logger
+from loggissimo._logger import _LoggerView
+from constants import TMP_DIR
+
+
+def read_lines(path: str) -> list:
+    with open(path, "r") as file:
+        return [line.rstrip("\n") for line in file.readlines()]
+
+
+def test_bind():
+    path = f"{TMP_DIR}/bind.log"
+    log = Logger("bind")
+    log.add(path, format="$request_id|$extra[user]|$missing|$text", level="INFO")
+
+    instances = len(Logger._instances)
+    bound = log.bind(request_id=1).bind(user="admin")
+    bound.info("bound")
+    log.info("plain")
+    bound.opt(lazy=True).info("{}", lambda: "lazy")
+
+    assert read_lines(path) == [
+        "1|admin|$missing|bound",
+        "$request_id|$extra[user]|$missing|plain",
+        "1|admin|$missing|lazy",
+    ]
+    assert not hasattr(bound, "__dict__")
+    assert isinstance(bound, _LoggerView)
+    assert len(Logger._instances) == instances
+
+    log.remove(path)
+    os.remove(path)
+
+
+def test_missing_placeholders():
+    path = f"{TMP_DIR}/placeholders.log"
+    log = Logger("placeholders")
+    log.add(path, format="$extra[0]|${user}|$extra[user]|$text", level="INFO")
+
+    log.info("missing")
+    log.bind(**{"0": "zero", "user": "admin"}).info("bound")
+
+    assert read_lines(path) == [
+        "$extra[0]|${user}|$extra[user]|missing",
+        "zero|admin|admin|bound",
+    ]
+
+    log.remove(path)
+    os.remove(path)
+
+
+def test_contextualize():
+    path = f"{TMP_DIR}/contextualize.json"
+    log = Logger("contextualize")
+    log.add(path, level="INFO", serialize="json")
+
+    async def handle(request_id: int):
+        with log.contextualize(request_id=request_id):
+            await asyncio.sleep(0.01)
+            log.bind(user=request_id).info("task")
+
+    async def main():
+        await asyncio.gather(*(handle(request_id) for request_id in range(5)))
+
+    asyncio.run(main())
+
+    with log.contextualize(request_id="main"):
+        thread = threading.Thread(target=log.info, args=("thread",))
+        thread.start()
+        thread.join()
+
+    records = [json.loads(line) for line in read_lines(path)]
+    assert sorted(
+        (record["extra"]["request_id"], record["extra"]["user"])
+        for record in records[:5]
+    ) == [(request_id, request_id) for request_id in range(5)]
+    assert records[5]["extra"] == {}
+
+    log.remove(path)
+    os.remove(path)
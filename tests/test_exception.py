@@ -0,0 +1,142 @@
+import io
+import json
+import os
+import sys
+
+from loggissimo import Logger, MemorySink
+from loggissimo._exception import Occurrences
+from constants import TMP_DIR
+
+
+def fail(number: int):
+    raise ValueError(f"bad value {number}")
+
+
+def read(path: str) -> str:
+    with open(path, "r") as file:
+        return file.read()
+
+
+def test_exception_traceback():
+    path = f"{TMP_DIR}/exception.log"
+    log = Logger("exception")
+    log.add(path, format="$level $text", level="INFO")
+
+    for number in range(3):
+        try:
+            fail(number)
+        except ValueError:
+            log.exception("failed {}", number)
+
+    lines = read(path).splitlines()
+    assert lines[0] == "ERROR     failed 0"
+    assert lines[1] == "Traceback (most recent call last):"
+    assert lines[2].endswith("in test_exception_traceback")
+    assert lines[3] == "    fail(number)"
+    assert lines[4].endswith("in fail")
+    assert lines[6] == "ValueError: bad value 0"
+    assert lines[7] == "ERROR     failed 1"
+    assert lines[8].startswith("ValueError: bad value 1 [traceback ")
+    assert lines[8].endswith(" repeated, 2 occurrences]")
+    assert lines[10].endswith(" repeated, 3 occurrences]")
+    assert len(lines) == 11
+
+    log.remove(path)
+    os.remove(path)
+
+
+def test_exception_counted_per_logger():
+    paths = [f"{TMP_DIR}/exception_{name}.log" for name in ("first", "second")]
+    loggers = [Logger(f"exception_{name}") for name in ("first", "second")]
+    for log, path in zip(loggers, paths):
+        log.add(path, format="$text", level="INFO")
+
+    for log in loggers:
+        try:
+            fail(0)
+        except ValueError:
+            log.exception("failed")
+
+    for log, path in zip(loggers, paths):
+        assert read(path).splitlines()[1] == "Traceback (most recent call last):"
+        log.remove(path)
+        os.remove(path)
+
+
+def test_occurrences_window():
+    occurrences = Occurrences()
+    assert [occurrences.count(1) for _ in range(3)] == [1, 2, 3]
+    assert occurrences.count(2) == 1
+
+    expired = Occurrences(window=0)
+    assert [expired.count(1) for _ in range(3)] == [1, 1, 1]
+
+
+def test_exc_info_chained():
+    path = f"{TMP_DIR}/exc_info.log"
+    log = Logger("exc_info")
+    log.add(path, format="$text", level="INFO")
+
+    try:
+        try:
+            fail(0)
+        except ValueError as error:
+            raise RuntimeError("wrapped") from error
+    except RuntimeError as error:
+        log.warning("warned", exc_info=error)
+    log.info("no exception", exc_info=True)
+
+    text = read(path)
+    assert "ValueError: bad value 0\n" in text
+    assert "The above exception was the direct cause" in text
+    assert text.endswith("RuntimeError: wrapped\nno exception\n")
+
+    log.remove(path)
+    os.remove(path)
+
+
+def test_exception_structured():
+    path = f"{TMP_DIR}/exception.json"
+    sink = MemorySink(format="$text")
+    log = Logger("exception_structured")
+    log.add(path, level="INFO", serialize="json")
+    log.add(sink, level="INFO")
+
+    try:
+        fail(7)
+    except ValueError:
+        log.exception("structured")
+
+    with open(path, "r") as file:
+        record = json.loads(file.readline())
+    exception = record["exception"]
+    assert exception["type"] == "ValueError"
+    assert exception["message"] == "bad value 7"
+    assert exception["frames"][-1][2] == "fail"
+
+    (captured,) = sink.query(level="ERROR")
+    assert captured.exception.type == "ValueError"
+    assert "ValueError: bad value 7" in sink.render()
+
+    log.remove(path)
+    log.remove(sink.name)
+    os.remove(path)
+
+
+def test_internal_error_to_streams():
+    stream = io.StringIO()
+    stream.name = "<internal>"
+    log = Logger("internal_error")
+    log.clear()
+    log.add(stream, format="$stack: $text", level="INFO")
+
+    log.info("{} {}", 1)
+    line = sys._getframe().f_lineno - 1
+
+    text = stream.getvalue()
+    assert text.startswith(
+        f"test_exception:{line} test_internal_error_to_streams: "
+        "Loggissimo error: Replacement index 1 out of range"
+    )
+    assert "IndexError: Replacement index 1 out of range" in text
+    log.clear()
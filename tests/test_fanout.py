@@ -0,0 +1,126 @@
+import os
+
+from loggissimo import Level, Logger
+from constants import TMP_DIR
+
+RECORDS = 10
+
+
+def test_render_once_per_format():
+    paths = [f"{TMP_DIR}/fanout_{number}.log" for number in range(3)]
+    log = Logger("fanout")
+    log.clear()
+    for path in paths:
+        log.add(path, level="INFO")
+    log.add(f"{TMP_DIR}/fanout_json.log", level="INFO", serialize="json")
+    paths.append(f"{TMP_DIR}/fanout_json.log")
+
+    before = log.stats()
+    for number in range(RECORDS):
+        log.info("record {}", number)
+    after = log.stats()
+
+    assert after["records"] - before["records"] == RECORDS
+    assert after["renders"] - before["renders"] == RECORDS * 2
+    assert after["writes"] - before["writes"] == RECORDS * 4
+
+    for path in paths[:3]:
+        with open(path, "r") as file:
+            assert len(file.readlines()) == RECORDS
+
+    for path in paths:
+        log.remove(path)
+        os.remove(path)
+
+
+def test_coalesce_same_descriptor():
+    path = f"{TMP_DIR}/coalesce.log"
+    first = open(path, "w", buffering=1)
+    second = open(first.fileno(), "w", buffering=1, closefd=False)
+
+    log = Logger("coalesce")
+    log.clear()
+    log.add(first, level="INFO")
+    log.add(second, format="$text", level="INFO")
+
+    before = log.stats()
+    for number in range(RECORDS):
+        log.info("record {}", number)
+    after = log.stats()
+
+    assert after["renders"] - before["renders"] == RECORDS * 2
+    assert after["writes"] - before["writes"] == RECORDS
+
+    with open(path, "r") as file:
+        lines = file.readlines()
+    assert len(lines) == RECORDS * 2
+    assert lines[1] == "record 0\n"
+
+    log.clear()
+    second.close()
+    first.close()
+    os.remove(path)
+
+
+class Recorder:
+    def __init__(self, name: str, flush_level=None) -> None:
+        self.name = name
+        self.flush_level = flush_level
+        self.closed = False
+        self.writes = []
+        self.flushes = 0
+
+    def fileno(self) -> int:
+        return 1000
+
+    def write(self, message: str) -> int:
+        self.writes.append(message)
+        return len(message)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+def test_coalesce_strictest_flush_level():
+    first = Recorder("first")
+    second = Recorder("second", flush_level=Level.ERROR)
+
+    log = Logger("coalesce_flush")
+    log.clear()
+    log.add(first, format="$text", level="INFO")
+    log.add(second, format="$level $text", level="INFO")
+
+    log.info("info")
+    assert first.flushes == 0
+    log.error("error")
+
+    assert first.flushes == 1
+    assert len(first.writes) == 2
+    assert first.writes[1].startswith("error\nERROR")
+    assert second.writes == []
+
+    log.clear()
+
+
+def test_coalesce_text_and_binary():
+    path = f"{TMP_DIR}/coalesce_mixed.log"
+    text = open(path, "w", buffering=1)
+    binary = open(text.fileno(), "wb", buffering=0, closefd=False)
+
+    log = Logger("coalesce_mixed")
+    log.clear()
+    log.add(text, format="$text", level="INFO")
+    log.add(binary, level="INFO", serialize="binary")
+
+    before = log.stats()
+    log.info("mixed")
+    after = log.stats()
+
+    assert after["writes"] - before["writes"] == 2
+    with open(path, "rb") as file:
+        assert file.read().startswith(b"mixed\n")
+
+    log.clear()
+    binary.close()
+    text.close()
+    os.remove(path)
@@ -0,0 +1,60 @@
+import os
+import glob
+import gzip
+import time
+import shutil
+
+from datetime import timedelta
+
+from loggissimo import FileStream, Logger
+from constants import TMP_DIR
+
+
+def test_rotation_by_size():
+    directory = f"{TMP_DIR}/rotation_size"
+    os.makedirs(directory, exist_ok=True)
+    path = f"{directory}/app.log"
+
+    stream = FileStream(path, rotation=1024, retention=3, compression="gz")
+    log = Logger("rotation-size")
+    log.add(stream, level="INFO")
+
+    for number in range(200):
+        log.info("line {}", number)
+    stream.flush()
+
+    rotated = sorted(glob.glob(f"{path}.*"))
+    assert len(rotated) == 3
+    assert all(file.endswith(".gz") for file in rotated)
+    assert os.path.getsize(path) < 1024 + 200
+
+    with gzip.open(rotated[-1], "rt") as file:
+        assert "rotation-size" in file.readline()
+
+    log.remove(path)
+    stream.close()
+    shutil.rmtree(directory)
+
+
+def test_rotation_by_time_appends():
+    directory = f"{TMP_DIR}/rotation_time"
+    os.makedirs(directory, exist_ok=True)
+    path = f"{directory}/app.log"
+
+    with open(path, "w") as file:
+        file.write("previous run\n")
+
+    stream = FileStream(path, rotation=timedelta(milliseconds=100))
+    stream.write("first\n")
+    time.sleep(0.15)
+    stream.write("second\n")
+    stream.close()
+
+    rotated = glob.glob(f"{path}.*")
+    assert len(rotated) == 1
+    with open(rotated[0], "r") as file:
+        assert file.readlines() == ["previous run\n", "first\n"]
+    with open(path, "r") as file:
+        assert file.readlines() == ["second\n"]
+
+    shutil.rmtree(directory)
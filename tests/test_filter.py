@@ -0,0 +1,55 @@
+import os
+
+from loggissimo import Logger
+from loggissimo._filter import ModuleFilter
+from constants import TMP_DIR
+
+from package.module1.functions import do_module1
+
+
+def test_most_specific_rule():
+    rules = ModuleFilter({"app": False, "app.api": True, "app.api.internal": False})
+
+    assert rules("app") is False
+    assert rules("app.db") is False
+    assert rules("app.api.views") is True
+    assert rules("app.api.internal.cache") is False
+    assert rules("other") is True
+    assert rules(None) is True
+
+
+def test_wildcard_rules():
+    rules = ModuleFilter({"plugins.*.debug": False})
+    assert rules("plugins.auth.debug") is False
+    assert rules("plugins.auth.debug.dump") is False
+    assert rules("plugins.auth") is True
+
+    rules.set("plugins.auth.*", True)
+    assert rules("plugins.auth.debug") is True
+    assert rules("plugins.other.debug") is False
+
+    rules.set("plugins.auth.debug", False)
+    assert rules("plugins.auth.debug") is False
+
+    rules.clear()
+    assert rules("plugins.auth.debug") is True
+
+
+def test_stream_modules():
+    path = f"{TMP_DIR}/stream_modules.log"
+    log = Logger()
+    log.enable("package.module1.functions")
+    log.add(path, level="INFO", modules={"package.module1": False})
+
+    do_module1()
+    log.info("main module")
+
+    with open(path, "r") as file:
+        lines = file.readlines()
+
+    assert len(lines) == 1
+    assert lines[0].endswith("main module\n")
+
+    log.disable("package.module1.functions")
+    log.remove(path)
+    os.remove(path)
@@ -0,0 +1,130 @@
+import io
+import os
+import sys
+import pytest
+
+from string import Template
+
+from loggissimo import Logger
+from loggissimo._style import color_depth, style
+from loggissimo._format import compile_format
+from loggissimo._context import Extra
+from loggissimo.constants import DEFAULT_FORMAT, Level
+from constants import TMP_DIR
+
+
+FORMATS = [
+    DEFAULT_FORMAT,
+    "<font=cyan>$name | <style=bold bg=1,2,3 font=255,0,0>$time | <font=yellow bg=red>$text",
+    "{braces} $$time $unknown ${text}",
+]
+
+
+@pytest.mark.parametrize("format", FORMATS)
+@pytest.mark.parametrize("level", list(Level))
+@pytest.mark.parametrize("basic_colors", [False, True])
+@pytest.mark.parametrize("only_remove_tags", [False, True])
+def test_compiled_format(format, level, basic_colors, only_remove_tags):
+    fields = dict(time="12:00:00", stack="module:1 func", text="message {0}")
+
+    expected = (
+        Template(style(format, level, basic_colors, only_remove_tags)).safe_substitute(
+            name=f"{'name':30}", level=f"{level.name:<9}", **fields
+        )
+        + "\n"
+    )
+    compiled = compile_format(format, level, basic_colors, only_remove_tags)
+
+    assert (
+        compiled.format(name="name", level=level.name, extra=Extra(), **fields)
+        == expected
+    )
+    assert compile_format(format, level, basic_colors, only_remove_tags) is compiled
+
+
+class Terminal:
+    def isatty(self) -> bool:
+        return True
+
+
+@pytest.mark.parametrize(
+    "environ, depth",
+    [
+        ({"COLORTERM": "truecolor", "TERM": "xterm"}, 24),
+        ({"TERM": "xterm-256color"}, 8),
+        ({"TERM": "xterm"}, 4),
+        ({"TERM": "dumb"}, 0),
+        ({"NO_COLOR": "1", "COLORTERM": "truecolor"}, 0),
+    ],
+)
+def test_color_depth(monkeypatch, environ, depth):
+    for name in ("NO_COLOR", "COLORTERM", "TERM"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in environ.items():
+        monkeypatch.setenv(name, value)
+
+    assert color_depth(Terminal()) == depth
+
+
+def test_color_depth_pipe(monkeypatch):
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    monkeypatch.setenv("COLORTERM", "truecolor")
+    monkeypatch.setenv("TERM", "xterm-256color")
+
+    assert color_depth(io.StringIO()) == 0
+
+
+def test_auto_rgb(monkeypatch):
+    log = Logger("auto-rgb")
+    rgb = log.rgb
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    monkeypatch.setenv("COLORTERM", "truecolor")
+    monkeypatch.setattr(sys, "stdout", Terminal())
+    try:
+        log.rgb = None
+        assert log.rgb is True
+        monkeypatch.delenv("COLORTERM")
+        monkeypatch.setenv("TERM", "dumb")
+        log.rgb = None
+        assert log.rgb is False
+    finally:
+        log.rgb = rgb
+
+
+def test_auto_rgb_without_colors(monkeypatch):
+    path = f"{TMP_DIR}/no_color.log"
+    log = Logger("auto-no-color", force_colorize=True)
+    log.add(path, format="<font=red>$level $text", level="INFO")
+    rgb = log.rgb
+    monkeypatch.setenv("NO_COLOR", "1")
+    try:
+        log.rgb = None
+        log.info("plain")
+        log.rgb = True
+        log.info("colored")
+    finally:
+        log.rgb = rgb
+
+    with open(path, "r") as file:
+        lines = file.readlines()
+    assert "\x1b" not in lines[0] and lines[0].endswith("plain\n")
+    assert "\x1b" in lines[1]
+
+    log.remove(path)
+    os.remove(path)
+
+
+def test_format_setter():
+    path = f"{TMP_DIR}/format_setter.log"
+    log = Logger("format_setter", file=path, format="A $text")
+
+    log.info("first")
+    log.format = "B $text"
+    log.info("second")
+    log.complete()
+
+    with open(path, "r") as file:
+        assert file.readlines() == ["A first\n", "B second\n"]
+
+    log.clear()
+    os.remove(path)
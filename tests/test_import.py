@@ -0,0 +1,74 @@
+import os
+import re
+import subprocess
+import sys
+
+# Microseconds `import loggissimo` with plain file logging may take, including its dependencies.
+# Measured at 32-41 ms, the eager imports took 53-67 ms.
+IMPORT_BUDGET = 50_000
+
+HEAVY_MODULES = ("asyncio", "multiprocessing", "colorcall", "json", "inspect")
+
+SCRIPT = """
+import sys
+from loggissimo import Logger
+log = Logger("import-time", file=sys.argv[1])
+log.clear()
+log.add(sys.argv[1] + ".plain", format="$time $text")
+log.info("plain")
+print(",".join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+IMPORT_TIME = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def test_import_time(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = str(tmp_path / "import.log")
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            SCRIPT.format(heavy=HEAVY_MODULES),
+            path,
+        ],
+        env={**os.environ, "PYTHONPATH": root},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total = 0
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match and len(match.group(2)) == 0 and match.group(3).startswith("loggissimo"):
+            total += int(match.group(1))
+
+    assert result.stdout.strip() == ""
+    assert 0 < total < IMPORT_BUDGET, f"loggissimo import: {total / 1000:.1f} ms"
+
+
+DEFAULT_SCRIPT = """
+import gc
+import sys
+from loggissimo import Logger
+Logger().add(sys.argv[1], format="$text")
+gc.collect()
+Logger().info("hello")
+"""
+
+
+def test_default_logger_persists(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = str(tmp_path / "default.log")
+    subprocess.run(
+        [sys.executable, "-c", DEFAULT_SCRIPT, path],
+        env={**os.environ, "PYTHONPATH": root},
+        capture_output=True,
+        check=True,
+    )
+
+    with open(path, "r") as file:
+        assert file.read() == "hello\n"
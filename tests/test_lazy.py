@@ -0,0 +1,49 @@
+import os
+
+from loggissimo import Logger
+from constants import TMP_DIR
+
+
+def test_deferred_arguments():
+    path = f"{TMP_DIR}/deferred.log"
+    log = Logger("deferred")
+    log.add(path, level="INFO")
+
+    assert log.info("{} + {two} = {}", 1, 3, two=2) == "1 + 2 = 3"
+    assert log.debug("{} {}", 1) == "{} {}"
+
+    with open(path, "r") as file:
+        lines = file.readlines()
+
+    assert len(lines) == 1
+    assert lines[0].endswith("1 + 2 = 3\n")
+
+    log.remove(path)
+    os.remove(path)
+
+
+def test_lazy_callables():
+    path = f"{TMP_DIR}/lazy.log"
+    log = Logger("lazy")
+    log.add(path, level="INFO")
+    calls = []
+
+    def expensive() -> str:
+        calls.append(1)
+        return "expensive"
+
+    log.opt(lazy=True).debug("{}", expensive)
+    assert not calls
+
+    assert log.opt(lazy=True).info("{} {value}", expensive, value=expensive) == (
+        "expensive expensive"
+    )
+    assert len(calls) == 2
+
+    with open(path, "r") as file:
+        line = file.readline()
+
+    assert "test_lazy:" in line and "test_lazy_callables" in line
+
+    log.remove(path)
+    os.remove(path)
@@ -0,0 +1,139 @@
+import os
+import pytest
+import threading
+
+from loggissimo import Limit, Logger, RateLimit, Sample, Throttle
+from loggissimo._limits import Suppressed
+from loggissimo.exceptions import LoggissimoError
+from constants import TMP_DIR
+
+
+def read_lines(path: str):
+    with open(path, "r") as file:
+        return file.read().splitlines()
+
+
+def test_throttle():
+    path = f"{TMP_DIR}/throttle.log"
+    log = Logger("throttle")
+    log.add(path, format="$text", level="INFO")
+    log.limit(Throttle(first=3, every=10))
+
+    for number in range(100):
+        log.info("{}", number)
+    log.complete()
+
+    lines = read_lines(path)
+    assert lines[:3] == ["0", "1", "2"]
+    assert lines[3:12] == [str(number) for number in range(12, 100, 10)]
+    assert lines[12] == "Suppressed 88 messages from test_limits:23 test_throttle"
+
+    log.limit()
+    log.remove(path)
+    os.remove(path)
+
+
+def test_throttle_threads():
+    path = f"{TMP_DIR}/throttle_threads.log"
+    log = Logger("throttle_threads")
+    log.add(path, format="$text", level="INFO")
+    log.limit(Throttle(first=0, every=100))
+
+    def target():
+        for _ in range(1000):
+            log.info("line")
+
+    threads = [threading.Thread(target=target) for _ in range(8)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    log.complete()
+
+    lines = read_lines(path)
+    assert lines.count("line") == 80
+    assert lines[-1].startswith("Suppressed 7920 messages")
+
+    log.limit()
+    log.remove(path)
+    os.remove(path)
+
+
+def test_sample_scope():
+    path = f"{TMP_DIR}/sample.log"
+    log = Logger("sample")
+    log.add(path, format="$text", level="DEBUG")
+    log.limit(Sample(0.0, level="DEBUG"), Sample(0.0, module="other"), interval=3600)
+
+    for _ in range(10):
+        log.debug("debug")
+        log.info("info")
+
+    lines = read_lines(path)
+    assert lines == ["info"] * 10
+
+    log.limit()
+    log.remove(path)
+    os.remove(path)
+
+
+def test_rate_limit():
+    path = f"{TMP_DIR}/rate.log"
+    log = Logger("rate")
+    log.add(path, format="$text", level="INFO")
+    log.limit(RateLimit(0.001, burst=5), interval=3600)
+
+    for _ in range(100):
+        log.info("first site")
+    log.info("second site")
+
+    lines = read_lines(path)
+    assert lines == ["first site"] * 5 + ["second site"]
+
+    log.limit()
+    log.remove(path)
+    os.remove(path)
+
+
+def test_disabled_not_counted():
+    path = f"{TMP_DIR}/disabled_limit.log"
+    log = Logger("disabled_limit")
+    log.add(path, format="$text", level="INFO")
+    log.limit(Throttle(first=1), interval=3600)
+
+    for _ in range(10):
+        log.debug("debug")
+    for _ in range(2):
+        log.info("info")
+
+    assert read_lines(path) == ["info"]
+
+    log.limit()
+    log.remove(path)
+    os.remove(path)
+
+
+def test_limit_validation():
+    with pytest.raises(TypeError):
+        Limit()
+    with pytest.raises(LoggissimoError):
+        RateLimit(0)
+
+
+def test_suppressed_thread_churn():
+    suppressed = Suppressed(3600)
+    site = (test_suppressed_thread_churn.__code__, 1)
+
+    for _ in range(3):
+        threads = [
+            threading.Thread(target=suppressed.add, args=("worker", site))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert suppressed.collect() == [("worker", site, 10)]
+        assert suppressed._counters == []
+
+    suppressed.add("worker", site)
+    assert suppressed.collect() == [("worker", site, 1)]
+    assert len(suppressed._counters) == 1
@@ -0,0 +1,118 @@
+import gc
+import io
+import time
+import weakref
+
+from loggissimo import Logger, LogRecord, MemorySink
+
+
+def test_memory_records():
+    sink = MemorySink(size=5)
+    log = Logger("memory")
+    log.add(sink, level="DEBUG")
+
+    for number in range(10):
+        log.debug("record {}", number)
+
+    records = list(sink)
+    assert len(sink) == 5
+    assert all(isinstance(record, LogRecord) for record in records)
+    assert [record.message for record in records] == [
+        f"record {number}" for number in range(5, 10)
+    ]
+    assert records[0].module == "test_memory"
+    assert records[0].function == "test_memory_records"
+
+    log.remove(sink.name)
+
+
+def test_memory_query():
+    sink = MemorySink()
+    log = Logger("memory_query")
+    log.add(sink, level="DEBUG")
+
+    log.debug("debug")
+    start = time.time()
+    log.warning("warning")
+    log.error("error")
+
+    assert [record.message for record in sink.query(level="WARNING")] == [
+        "warning",
+        "error",
+    ]
+    assert [record.message for record in sink.query(since=start)] == [
+        "warning",
+        "error",
+    ]
+    assert [record.message for record in sink.query(until=start)] == ["debug"]
+    assert len(sink.query(module="test_memory")) == 3
+    assert sink.query(module="test") == []
+
+    log.remove(sink.name)
+
+
+def test_memory_render():
+    sink = MemorySink(format="$level $stack: <font=red>$text $user")
+    log = Logger("memory_render")
+    log.add(sink, level="INFO")
+
+    log.bind(user="root").info("rendered {}", "later")
+
+    assert sink.render() == (
+        "INFO      test_memory:59 test_memory_render: rendered later root\n"
+    )
+    assert sink.render(format="$text") == "rendered later\n"
+
+    log.remove(sink.name)
+
+
+def test_flight_recorder():
+    output = io.StringIO()
+    sink = MemorySink(format="$text", flight=3, flight_stream=output)
+    log = Logger("flight")
+    log.add(sink, level="DEBUG")
+
+    for number in range(10):
+        log.debug("step {}", number)
+    assert output.getvalue() == ""
+
+    log.error("failed")
+    assert output.getvalue().splitlines() == ["step 8", "step 9", "failed"]
+
+    log.remove(sink.name)
+
+
+def test_memory_monotonic_time():
+    sink = MemorySink(format="$time $text", time="monotonic")
+    log = Logger("memory_monotonic")
+    log.add(sink, level="INFO")
+
+    log.info("logged")
+    logged = time.monotonic()
+    time.sleep(0.05)
+
+    assert float(sink.render().split()[0]) <= logged
+
+    log.remove(sink.name)
+
+
+def test_memory_releases_arguments():
+    class Payload:
+        def __str__(self) -> str:
+            return "payload"
+
+    sink = MemorySink()
+    log = Logger("memory_release")
+    log.add(sink, level="INFO")
+
+    payload = Payload()
+    reference = weakref.ref(payload)
+    log.info("{}", payload)
+    log.opt(lazy=True).info("{value}", value=lambda: payload)
+    del payload
+    gc.collect()
+
+    assert reference() is None
+    assert [record.message for record in sink] == ["payload", "payload"]
+
+    log.remove(sink.name)
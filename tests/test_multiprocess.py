@@ -0,0 +1,60 @@
+import os
+import pytest
+import multiprocessing
+
+from typing import Final
+
+from loggissimo import Logger, ProcessStream
+from constants import TMP_DIR
+
+PROC_COUNT: Final[int] = 8
+LINES: Final[int] = 200
+
+
+def target(name: str, stream: ProcessStream):
+    log = Logger(name)
+    log.add(stream, level="INFO")
+
+    for number in range(LINES):
+        log.info(f"{name} line {number}")
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_process_stream(method: str):
+    path = f"{TMP_DIR}/multiprocess_{method}.log"
+    stream = ProcessStream(path, context=method)
+    context = multiprocessing.get_context(method)
+
+    processes = [
+        context.Process(target=target, args=(f"{method}-{_}", stream))
+        for _ in range(PROC_COUNT)
+    ]
+    [proc.start() for proc in processes]
+    [proc.join() for proc in processes]
+    stream.close()
+
+    with open(path, "r") as file:
+        lines = file.readlines()
+
+    assert len(lines) == PROC_COUNT * LINES
+    for _ in range(PROC_COUNT):
+        own = [line for line in lines if f"{method}-{_} line" in line]
+        assert [line.rsplit(" ", 1)[-1] for line in own] == [
+            f"{number}\n" for number in range(LINES)
+        ]
+
+    os.remove(path)
+
+
+def test_write_after_complete():
+    path = f"{TMP_DIR}/multiprocess_complete.log"
+    stream = ProcessStream(path)
+    stream.write("queued\n")
+    stream.complete()
+    stream.write("late\n")
+    stream.close()
+
+    with open(path, "r") as file:
+        assert file.readlines() == ["queued\n", "late\n"]
+
+    os.remove(path)
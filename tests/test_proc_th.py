@@ -5,7 +5,7 @@ import pytest
 
 from typing import Final
 from random import randint
-from threading import Thread
+from threading import Barrier, Thread, current_thread
 from multiprocessing import Process
 
 from loggissimo import Logger
@@ -53,3 +53,34 @@ def test_process(ProcTh: Process | Thread):
             assert find, f"Can't find processes line in file {path}"
         finally:
             os.remove(path)
+
+
+def test_shared_logger_thread_names():
+    path = f"{TMP_DIR}/shared_threads.log"
+    log = Logger("shared")
+    log.add(path, level="INFO")
+    barrier = Barrier(PROC_COUNT)
+
+    def shared_target():
+        barrier.wait()
+        for _ in range(20):
+            log.info(current_thread().name)
+
+    threads = [
+        Thread(target=shared_target, name=f"{PROCESS_NAME}{_}")
+        for _ in range(PROC_COUNT)
+    ]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+
+    try:
+        with open(path, "r") as file:
+            lines = file.readlines()
+
+        assert len(lines) == PROC_COUNT * 20
+        for line in lines:
+            label, message = re.findall(rf"\(({PROCESS_NAME}[0-9]+)\).*: (\S+)", line)[0]
+            assert label == message
+    finally:
+        log.remove(path)
+        os.remove(path)
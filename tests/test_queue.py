@@ -0,0 +1,111 @@
+import gc
+import os
+import time
+import pytest
+import threading
+import weakref
+
+from loggissimo import Logger, Overflow, QueuedStream
+from constants import TMP_DIR
+
+LINES = 1000
+
+
+class SlowStream:
+    name = "slow"
+    closed = False
+
+    def __init__(self) -> None:
+        self.lines = []
+        self.release = threading.Event()
+
+    def write(self, message: str) -> int:
+        self.release.wait()
+        self.lines.extend(message.splitlines())
+        return len(message)
+
+    def flush(self) -> None:
+        pass
+
+
+def test_enqueue_file():
+    path = f"{TMP_DIR}/enqueue.log"
+    log = Logger("enqueue")
+    log.add(path, level="INFO", enqueue=True)
+
+    for number in range(LINES):
+        log.info("line {}", number)
+    log.complete()
+
+    with open(path, "r") as file:
+        lines = file.readlines()
+
+    assert len(lines) == LINES
+    assert lines[-1].endswith(f"line {LINES - 1}\n")
+
+    log.remove(path)
+    os.remove(path)
+
+
+@pytest.mark.parametrize(
+    "overflow,expected",
+    [
+        (Overflow.DROP_NEWEST, ["0", "1", "2"]),
+        (Overflow.DROP_OLDEST, ["0", "3", "4"]),
+    ],
+)
+def test_overflow(overflow: Overflow, expected: list):
+    slow = SlowStream()
+    stream = QueuedStream(slow, size=2, overflow=overflow)
+
+    stream.write("0\n")
+    while stream._queue:
+        time.sleep(0.01)
+
+    for number in range(1, 5):
+        stream.write(f"{number}\n")
+    slow.release.set()
+    stream.complete()
+
+    assert slow.lines == expected
+    assert stream.dropped == 2
+
+    stream.write("sync\n")
+    assert slow.lines[-1] == "sync"
+
+
+def test_blocked_producer_after_complete():
+    slow = SlowStream()
+    stream = QueuedStream(slow, size=1)
+
+    stream.write("0\n")
+    while stream._queue:
+        time.sleep(0.01)
+    stream.write("1\n")
+
+    producer = threading.Thread(target=stream.write, args=("2\n",))
+    producer.start()
+    completion = threading.Thread(target=stream.complete)
+    completion.start()
+    time.sleep(0.05)
+
+    slow.release.set()
+    producer.join()
+    completion.join()
+
+    assert slow.lines == ["0", "1", "2"]
+
+
+def test_completed_stream_is_collected():
+    slow = SlowStream()
+    slow.release.set()
+    stream = QueuedStream(slow)
+    stream.write("0\n")
+    stream.complete()
+
+    reference = weakref.ref(stream)
+    del stream
+    gc.collect()
+
+    assert reference() is None
+    assert slow.lines == ["0"]
@@ -0,0 +1,73 @@
+import threading
+
+from loggissimo import Level, Logger, MemorySink
+
+THREADS = 32
+
+
+def test_registry_creation():
+    barrier = threading.Barrier(THREADS)
+    instances = []
+
+    def target():
+        barrier.wait()
+        instances.append(Logger("registry"))
+
+    threads = [threading.Thread(target=target) for _ in range(THREADS)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+
+    assert len(instances) == THREADS
+    assert all(instance is instances[0] for instance in instances)
+
+
+def test_concurrent_streams():
+    log = Logger("registry_streams")
+    base = MemorySink()
+    log.clear()
+    log.add(base, level="INFO")
+    sinks = [MemorySink() for _ in range(THREADS)]
+    barrier = threading.Barrier(THREADS * 2)
+    done = threading.Event()
+
+    def add(sink: MemorySink):
+        barrier.wait()
+        log.add(sink, level="INFO")
+        log.remove(sink.name)
+        log.add(sink, level="INFO")
+
+    def write():
+        barrier.wait()
+        while not done.is_set():
+            log.info("record")
+
+    adders = [threading.Thread(target=add, args=(sink,)) for sink in sinks]
+    writers = [threading.Thread(target=write) for _ in range(THREADS)]
+    [thread.start() for thread in adders + writers]
+    [thread.join() for thread in adders]
+    done.set()
+    [thread.join() for thread in writers]
+
+    assert {entry.stream.name for entry in log._streams} == {
+        sink.name for sink in [base, *sinks]
+    }
+    log.info("last")
+    assert all(list(sink)[-1].message == "last" for sink in sinks)
+    log.clear()
+
+
+def test_verdicts_follow_stream_table():
+    log = Logger("registry_verdicts")
+    sink = MemorySink()
+    log.clear()
+    log.add(sink, level="INFO")
+    (old,), old_verdicts = log._table
+
+    # Stream re-added with a lower level while a log call still iterates the old table
+    log.add(sink, level="DEBUG")
+    assert not log._is_enabled(old, Level.DEBUG, "test_registry", old_verdicts)
+
+    log.debug("debug")
+    assert [record.message for record in sink] == ["debug"]
+
+    log.clear()
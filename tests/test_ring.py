@@ -0,0 +1,89 @@
+import os
+import subprocess
+import sys
+import threading
+
+from loggissimo import Logger, RingStream, read_ring
+from constants import TMP_DIR
+
+
+def test_ring_order():
+    path = f"{TMP_DIR}/order.ring"
+    stream = RingStream(path, size=4096)
+    log = Logger("ring")
+    log.add(stream, format="$text", level="INFO")
+
+    for number in range(1000):
+        log.info("line {}", number)
+    log.remove(path)
+
+    records = [record.decode().rstrip("\n") for record in read_ring(path)]
+    assert records[-1] == "line 999"
+    assert records == [f"line {number}" for number in range(1000 - len(records), 1000)]
+    assert 100 < len(records) < 1000
+
+    stream.close()
+    os.remove(path)
+
+
+def test_ring_reopen():
+    path = f"{TMP_DIR}/reopen.ring"
+    stream = RingStream(path, size=1024)
+    stream.write("first\n")
+    stream.close()
+
+    stream = RingStream(path, size=1024)
+    stream.write("second\n")
+    stream.close()
+
+    assert list(read_ring(path)) == [b"first\n", b"second\n"]
+    os.remove(path)
+
+
+def test_ring_threads():
+    path = f"{TMP_DIR}/threads.ring"
+    stream = RingStream(path, size=1024 * 1024)
+
+    def target(number: int):
+        for line in range(200):
+            stream.write(f"{number}-{line}\n")
+
+    threads = [threading.Thread(target=target, args=(_,)) for _ in range(8)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    stream.close()
+
+    assert sorted(read_ring(path)) == sorted(
+        f"{number}-{line}\n".encode() for number in range(8) for line in range(200)
+    )
+    os.remove(path)
+
+
+def test_ring_crash():
+    path = f"{TMP_DIR}/crash.ring"
+    code = (
+        "import os\n"
+        "from loggissimo import Logger, RingStream\n"
+        "log = Logger('crash')\n"
+        f"log.add(RingStream({path!r}, size=4096), format='$text', level='INFO')\n"
+        "for number in range(300):\n"
+        "    log.info('before crash {}', number)\n"
+        "os._exit(1)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": root},
+        capture_output=True,
+    )
+
+    dump = subprocess.run(
+        [sys.executable, "-m", "loggissimo.ring", "dump", path],
+        env={**os.environ, "PYTHONPATH": root},
+        capture_output=True,
+        text=True,
+    )
+    lines = dump.stdout.splitlines()
+    assert lines[-1] == "before crash 299"
+    assert all(line.startswith("before crash") for line in lines)
+    os.remove(path)
@@ -0,0 +1,59 @@
+import os
+import json
+import time
+
+from loggissimo import Logger, Serializer, read_binary
+from constants import TMP_DIR
+
+
+def test_json():
+    path = f"{TMP_DIR}/records.json"
+    log = Logger("json")
+    log.add(path, level="INFO", serialize="json")
+
+    start = time.monotonic()
+    log.info("hello {}", "json")
+    log.debug("skipped")
+
+    with open(path, "r") as file:
+        lines = file.readlines()
+
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["name"] == "json"
+    assert record["level"] == "INFO"
+    assert record["message"] == "hello json"
+    assert record["module"] == "test_serialize"
+    assert record["function"] == "test_json"
+    assert record["process"] == os.getpid()
+    assert start <= record["monotonic"] <= time.monotonic()
+    assert "\x1b" not in lines[0]
+
+    log.remove(path)
+    os.remove(path)
+
+
+def test_binary():
+    path = f"{TMP_DIR}/records.bin"
+    log = Logger("binary")
+    log.add(path, level="INFO", serialize=Serializer.BINARY)
+
+    for number in range(3):
+        log.warning("record {}", number)
+    log.bind(big=2**64, small=-(2**63) - 1).warning("big")
+    log.remove(path)
+
+    with open(path, "rb") as file:
+        records = list(read_binary(file))
+
+    assert [record["message"] for record in records] == [
+        "record 0",
+        "record 1",
+        "record 2",
+        "big",
+    ]
+    assert records[3]["extra"] == {"big": str(2**64), "small": str(-(2**63) - 1)}
+    assert records[0]["levelno"] == 30
+    assert records[0]["extra"] == {}
+
+    os.remove(path)
@@ -0,0 +1,69 @@
+import os
+
+from loggissimo import Logger, MemorySink
+from loggissimo import _record, _utils
+from loggissimo._logger import _Logger
+from loggissimo._utils import caller_stack
+from constants import TMP_DIR
+
+
+def test_stack_rendered_on_demand(monkeypatch):
+    calls = []
+
+    def counted(*args):
+        calls.append(args)
+        return caller_stack(*args)
+
+    monkeypatch.setattr(_record, "caller_stack", counted)
+
+    path = f"{TMP_DIR}/stack.log"
+    log = Logger("stack")
+    log.clear()
+    log.add(path, format="$text", level="INFO")
+
+    log.info("no stack")
+    assert calls == []
+
+    log.add(MemorySink(format="$stack: $text"), level="INFO")
+    log.info("stack")
+    sink = log._streams[-1].stream
+    assert sink.render() == "test_stack:28 test_stack_rendered_on_demand: stack\n"
+    assert len(calls) == 1
+
+    with open(path, "r") as file:
+        assert file.readlines() == ["no stack\n", "stack\n"]
+
+    log.remove(path)
+    os.remove(path)
+
+
+def test_stack_cached_per_line():
+    _utils._stacks.clear()
+    code = test_stack_cached_per_line.__code__
+
+    first = caller_stack(code, 10, "package.module")
+    assert first == "package/module:10 test_stack_cached_per_line"
+    assert caller_stack(code, 10, "package.module") is first
+    assert len(_utils._stacks) == 1
+
+    assert caller_stack(code, 11, "package.module").endswith(
+        ":11 test_stack_cached_per_line"
+    )
+    assert len(_utils._stacks) == 2
+
+
+def test_disable_calling_module():
+    log = Logger("stack_disable")
+    source = "log.disable()"
+
+    exec(
+        source,
+        {"__name__": "stack_disabled", "__file__": "stack_disabled.py", "log": log},
+    )
+    assert _Logger._filter("stack_disabled") is False
+
+    # Interactive code has no module file, nothing is disabled
+    exec(source, {"__name__": "stack_interactive", "log": log})
+    assert _Logger._filter("stack_interactive") is True
+
+    log.enable("stack_disabled")
@@ -0,0 +1,31 @@
+import time
+import pytest
+
+from datetime import datetime
+
+from loggissimo._time import format_time
+from loggissimo.constants import EPOCH_TIME, MONOTONIC_TIME
+
+
+@pytest.mark.parametrize(
+    "time_format",
+    ["%H:%M:%S", "%Y-%m-%d %H:%M:%S.%f", "%f|%f %%f", "%s %z"],
+)
+def test_format_time(time_format: str):
+    for _ in range(3):
+        time_ns = time.time_ns()
+        expected = datetime.fromtimestamp(time_ns // 1000 / 1e6).strftime(
+            time_format
+        )
+        assert format_time(time_ns, time_format) == expected
+        assert format_time(time_ns + 1000, time_format) == datetime.fromtimestamp(
+            (time_ns + 1000) // 1000 / 1e6
+        ).strftime(time_format)
+
+
+def test_epoch_time():
+    assert format_time(1_700_000_000_123_456_789, EPOCH_TIME) == "1700000000.123457"
+
+
+def test_monotonic_time():
+    assert format_time(time.time_ns(), MONOTONIC_TIME, 12_500_000_000) == "12.500000"